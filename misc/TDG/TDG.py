@@ -4,6 +4,7 @@ import modules.data_managers as data_managers
 import modules.utility as utility
 import modules.save_load_tools as save_load_tools
 import modules.input_commands as input_commands
+import sys
 
 global_manager = data_managers.global_manager_template()
 global_manager.set(
@@ -12,7 +13,19 @@ global_manager.set(
 global_manager.set(
     "parameter_types", ["temperature", "roughness", "vegetation", "soil", "water"]
 )
+global_manager.set(
+    "parameter_bound_keys",
+    {
+        current_parameter_type: (
+            sys.intern(f"min_{current_parameter_type}"),
+            sys.intern(f"max_{current_parameter_type}"),
+        )
+        for current_parameter_type in global_manager.get("parameter_types")
+    },
+)  # min_parametername and max_parametername keys used in terrain dicts, built once rather than on each terrain save/load
 global_manager.set("terrain_list", [])
+global_manager.set("terrain_masks", "none")
+global_manager.set("terrain_lookup_cache", {})
 global_manager.set("point_list", [])
 global_manager.set("displayed_terrain", "none")
 global_manager.set("displayed_point", "none")
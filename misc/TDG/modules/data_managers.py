@@ -10,36 +10,17 @@ class global_manager_template:
     def __init__(self):
         """
         Description:
-            Initializes this object
+            Initializes this object. get and set are bound directly to this object's dictionary rather than wrapped in methods, since they are called in most loops
+                get(name): Returns the value in this object's dictionary corresponding to the inputted key
+                set(name, value): Sets or initializes the inputted value for the inputted key in this object's dictionary
         Input:
             None
         Output:
             None
         """
         self.global_dict = {}
-
-    def get(self, name):
-        """
-        Description:
-            Returns the value in this object's dictionary corresponding to the inputted key
-        Input:
-            string name: Name of a key in this object's dictionary
-        Output:
-            any type: The value corresponding to the inputted key's entry in this object's dictionary
-        """
-        return self.global_dict[name]
-
-    def set(self, name, value):
-        """
-        Description:
-            Sets or initializes the inputted value for the inputted key in this object's dictionary
-        Input:
-            string name: Name of the key in this object's dictionary to initialize/modify
-            any type value: Value corresponding to the new/modified key
-        Output:
-            None
-        """
-        self.global_dict[name] = value
+        self.get = self.global_dict.__getitem__
+        self.set = self.global_dict.__setitem__
 
 
 class actor_creation_manager_template:
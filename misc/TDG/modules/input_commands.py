@@ -8,8 +8,8 @@ def save(input_list, global_manager):
     global_manager.set("displayed_terrain", "none")
     file_path = global_manager.get("active_file_path")
     save_load_tools.save_terrains(global_manager)
-    while len(global_manager.get("terrain_list")) > 0:
-        global_manager.get("terrain_list")[0].remove()
+    for current_terrain in global_manager.get("terrain_list").copy():
+        current_terrain.remove()
     save_load_tools.load_terrains(file_path, global_manager)
 
 
@@ -115,6 +115,7 @@ def edit(input_list, global_manager):
         parameter_obj.min = 1
     if parameter_obj.max > 6:
         parameter_obj.max = 6
+    utility.invalidate_terrain_masks(global_manager)
 
 
 def edit_point(input_list, global_manager):
@@ -1,5 +1,6 @@
 from . import parameters
 from . import utility
+import math
 
 
 class terrain:
@@ -8,23 +9,30 @@ class terrain:
         Takes min_parametername and max_parametername as parameter_dict entries for each parameter type in parameter_types
         """
         self.global_manager = global_manager
+        self.parameter_types = tuple(global_manager.get("parameter_types"))
         self.parameter_dict = {}
         self.name = input_dict["name"]
-        for current_parameter_type in self.global_manager.get("parameter_types"):
+        parameter_bound_keys = global_manager.get("parameter_bound_keys")
+        for current_parameter_type in self.parameter_types:
+            min_key, max_key = parameter_bound_keys[current_parameter_type]
             self.parameter_dict[current_parameter_type] = parameters.parameter(
                 current_parameter_type,
-                input_dict[f"min_{current_parameter_type}"],
-                input_dict[f"max_{current_parameter_type}"],
+                input_dict[min_key],
+                input_dict[max_key],
             )
+        self.parameters = tuple(
+            self.parameter_dict.values()
+        )  # same parameter objects in parameter_types order, for loops that don't need to look parameters up by name
         global_manager.get("terrain_list").append(self)
+        utility.invalidate_terrain_masks(global_manager)
 
     def __str__(self):
+        parameter_keywords = self.global_manager.get("parameter_keywords")
         return_value = f"\nName: {self.name}"
-        for current_parameter_type in self.global_manager.get("parameter_types"):
-            current_parameter = self.parameter_dict[current_parameter_type]
+        for current_parameter in self.parameters:
             return_value += f"\n\t{str(current_parameter.name).capitalize()}: {str(current_parameter.min)}-{str(current_parameter.max)}"
-            return_value += f" ({self.global_manager.get('parameter_keywords')[current_parameter_type][current_parameter.min]})"
-            return_value += f" - {self.global_manager.get('parameter_keywords')[current_parameter_type][current_parameter.max]})"
+            return_value += f" ({parameter_keywords[current_parameter.name][current_parameter.min]})"
+            return_value += f" - {parameter_keywords[current_parameter.name][current_parameter.max]})"
         return_value += f"\n\tVolume: {self.volume()}"
         return_value += "\n"
         return return_value
@@ -33,94 +41,58 @@ class terrain:
         """
         Returns save_dict in same format that terrain takes as parameter_dict
         """
+        parameter_bound_keys = self.global_manager.get("parameter_bound_keys")
         save_dict = {}
         save_dict["name"] = self.name
-        for parameter_type in self.global_manager.get("parameter_types"):
-            current_parameter = self.parameter_dict[parameter_type]
-            save_dict[f"min_{current_parameter.name}"] = current_parameter.min
-            save_dict[f"max_{current_parameter.name}"] = current_parameter.max
+        for current_parameter in self.parameters:
+            min_key, max_key = parameter_bound_keys[current_parameter.name]
+            save_dict[min_key] = current_parameter.min
+            save_dict[max_key] = current_parameter.max
         return save_dict
 
     def remove(self):
-        self.global_manager.set(
-            "terrain_list",
-            utility.remove_from_list(self.global_manager.get("terrain_list"), self),
-        )
+        self.global_manager.get("terrain_list").remove(self)
+        utility.invalidate_terrain_masks(self.global_manager)
 
     def in_bounds(self, terrain_dict):
-        for current_parameter_type in self.global_manager.get("parameter_types"):
-            parameter_value = terrain_dict[current_parameter_type]
-            if not self.parameter_dict[current_parameter_type].in_bounds(
-                parameter_value
-            ):
-                return False
-        return True
+        return all(
+            current_parameter.in_bounds(terrain_dict[current_parameter.name])
+            for current_parameter in self.parameters
+        )
 
     def volume(self):
-        return_value = 1
-        for current_parameter_type in self.global_manager.get("parameter_types"):
-            return_value *= self.parameter_dict[current_parameter_type].width()
-        return return_value
+        return math.prod(
+            current_parameter.width() for current_parameter in self.parameters
+        )
 
     def expansion_possible(self, parameter, change):
-        test_parameter_dict = {}
-        parameter_types = self.global_manager.get("parameter_types")
-
         if (
             self.parameter_dict[parameter].min + change < 1
             or self.parameter_dict[parameter].max + change > 6
         ):
             return False
-        for a in range(
-            self.parameter_dict[parameter_types[0]].min,
-            self.parameter_dict[parameter_types[0]].max + 1,
-        ):
-            test_parameter_dict[parameter_types[0]] = a
-            for b in range(
-                self.parameter_dict[parameter_types[1]].min,
-                self.parameter_dict[parameter_types[1]].max + 1,
-            ):
-                test_parameter_dict[parameter_types[1]] = b
-                for c in range(
-                    self.parameter_dict[parameter_types[2]].min,
-                    self.parameter_dict[parameter_types[2]].max + 1,
-                ):
-                    test_parameter_dict[parameter_types[2]] = c
-                    for d in range(
-                        self.parameter_dict[parameter_types[3]].min,
-                        self.parameter_dict[parameter_types[3]].max + 1,
-                    ):
-                        test_parameter_dict[parameter_types[3]] = d
-                        for e in range(
-                            self.parameter_dict[parameter_types[4]].min,
-                            self.parameter_dict[parameter_types[4]].max + 1,
-                        ):
-                            test_parameter_dict[parameter_types[4]] = e
-                            if (
-                                change > 0
-                            ):  # forces value of test parameter w/ inputted change regardless of loop state
-                                test_parameter_dict[parameter] = (
-                                    self.parameter_dict[parameter].max + change
-                                )
-                            else:
-                                test_parameter_dict[parameter] = (
-                                    self.parameter_dict[parameter].min + change
-                                )
-                            if (
-                                utility.get_terrain(
-                                    test_parameter_dict, self.global_manager
-                                )
-                                != "none"
-                            ):
-                                return False
-        return True
+        test_bounds_dict = {}
+        for current_parameter in self.parameters:
+            test_bounds_dict[current_parameter.name] = (
+                current_parameter.min,
+                current_parameter.max,
+            )
+        if (
+            change > 0
+        ):  # forces value of test parameter w/ inputted change, only checking the slice being expanded into
+            new_value = self.parameter_dict[parameter].max + change
+        else:
+            new_value = self.parameter_dict[parameter].min + change
+        test_bounds_dict[parameter] = (new_value, new_value)
+        return utility.get_bounds_match_mask(test_bounds_dict, self.global_manager) == 0
 
 
 class point:
     def __init__(self, input_dict, global_manager):
         self.global_manager = global_manager
+        self.parameter_types = tuple(global_manager.get("parameter_types"))
         self.parameter_dict = {}
-        for current_parameter_type in self.global_manager.get("parameter_types"):
+        for current_parameter_type in self.parameter_types:
             self.parameter_dict[current_parameter_type] = input_dict[
                 current_parameter_type
             ]
@@ -128,62 +100,36 @@ class point:
 
     def __str__(self):
         segment_size = 30
+        parameter_keywords = self.global_manager.get("parameter_keywords")
         parameter_values = []
-        for current_parameter_type in self.global_manager.get("parameter_types"):
+        for current_parameter_type in self.parameter_types:
             parameter_values.append(str(self.parameter_dict[current_parameter_type]))
-        return_value = utility.comma_list(parameter_values)
-
-        for current_parameter_type in self.global_manager.get("parameter_types"):
-            current_line = self.fill_empty_space(
-                segment_size, current_parameter_type, False
-            )
+        lines = [utility.comma_list(parameter_values)]
+        adjacent_parameter_dict = self.parameter_dict.copy()
+        for current_parameter_type in self.parameter_types:
+            current_line = [current_parameter_type.ljust(segment_size)]
             for i in range(0, 6):
-                starting_text = f"{i + 1}: "
-                text = self.global_manager.get("parameter_keywords")[
-                    current_parameter_type
-                ][i + 1]
+                text = parameter_keywords[current_parameter_type][i + 1]
 
+                adjacent_parameter_dict[current_parameter_type] = i + 1
                 local_terrain = utility.get_terrain(
-                    self.generate_adjacent_parameter_dict(
-                        current_parameter_type, i + 1
-                    ),
-                    self.global_manager,
+                    adjacent_parameter_dict, self.global_manager
                 )
                 if local_terrain == "none":
                     text += "()"
                 else:
                     text += f"({local_terrain.name})"
-                current_line += f"{starting_text}{self.fill_empty_space(segment_size - 3, text, False)}"
-            return_value += f"\n{current_line}"
+                current_line.append(f"{i + 1}: {text.ljust(segment_size - 3)}")
+            adjacent_parameter_dict[current_parameter_type] = self.parameter_dict[
+                current_parameter_type
+            ]
+            lines.append("".join(current_line))
 
-            current_line = ""
+            current_line = []
             for i in range(0, 7):
                 text = ""
                 if self.parameter_dict[current_parameter_type] == i:
                     text = "X"
-                current_line += self.fill_empty_space(segment_size, text, False)
-            return_value += f"\n{current_line}\n"
-        return return_value
-
-    def generate_adjacent_parameter_dict(self, changed_parameter_type, new_value):
-        return_dict = {}
-        for current_parameter_type in self.global_manager.get("parameter_types"):
-            if current_parameter_type == changed_parameter_type:
-                return_dict[current_parameter_type] = new_value
-            else:
-                return_dict[current_parameter_type] = self.parameter_dict[
-                    current_parameter_type
-                ]
-        return return_dict
-
-    def fill_empty_space(self, length, string, to_start=True):
-        add_to_start = to_start  # True
-        string = str(string)
-        while len(string) < length:
-            if add_to_start:
-                string = f" {string}"
-                add_to_start = False
-            else:
-                string = f"{string} "
-                add_to_start = to_start  # True
-        return string
+                current_line.append(text.ljust(segment_size))
+            lines.append("".join(current_line) + "\n")
+        return "\n".join(lines)
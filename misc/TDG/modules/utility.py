@@ -3,21 +3,98 @@ def print_terrains(global_manager):
         print(current_terrain)
 
 
+def invalidate_terrain_masks(global_manager):
+    """
+    Marks the terrain masks as outdated so that they are rebuilt on the next terrain lookup and clears remembered terrain lookups - call whenever a terrain is
+        created, removed, or has its bounds edited
+    """
+    global_manager.set("terrain_masks", "none")
+    global_manager.set("terrain_lookup_cache", {})
+
+
+def get_terrain_masks(global_manager):
+    """
+    Returns a dictionary with parametername: {parametervalue: bitmask} for each parameter, where bit i of each bitmask is set if the terrain at index i of terrain_list
+        includes that parameter value. Each parameter's bounds across all terrains are stored together, so a lookup combines one integer per parameter rather than
+        checking every terrain separately
+    """
+    terrain_masks = global_manager.get("terrain_masks")
+    if terrain_masks == "none":
+        terrain_masks = {}
+        for current_parameter_type in global_manager.get("parameter_types"):
+            terrain_masks[current_parameter_type] = {}
+        for index, current_terrain in enumerate(global_manager.get("terrain_list")):
+            terrain_bit = 1 << index
+            for current_parameter in current_terrain.parameters:
+                value_masks = terrain_masks[current_parameter.name]
+                for value in range(current_parameter.min, current_parameter.max + 1):
+                    value_masks[value] = value_masks.get(value, 0) | terrain_bit
+        global_manager.set("terrain_masks", terrain_masks)
+    return terrain_masks
+
+
+def get_terrain_match_mask(terrain_dict, global_manager):
+    """
+    Returns a bitmask with bit i set if the terrain at index i of terrain_list includes the inputted parametername: parametervalue terrain_dict
+    """
+    match_mask = -1
+    for current_parameter_type, value_masks in get_terrain_masks(global_manager).items():
+        match_mask &= value_masks.get(terrain_dict[current_parameter_type], 0)
+        if match_mask == 0:
+            break
+    return match_mask
+
+
+def get_bounds_match_mask(bounds_dict, global_manager):
+    """
+    Returns a bitmask with bit i set if the terrain at index i of terrain_list includes any point within the inputted parametername: (min, max) bounds_dict - since
+        terrains are boxes, a terrain overlaps the bounds if it overlaps them along every parameter
+    """
+    match_mask = -1
+    for current_parameter_type, value_masks in get_terrain_masks(global_manager).items():
+        parameter_mask = 0
+        min_value, max_value = bounds_dict[current_parameter_type]
+        for value in range(min_value, max_value + 1):
+            parameter_mask |= value_masks.get(value, 0)
+        match_mask &= parameter_mask
+        if match_mask == 0:
+            break
+    return match_mask
+
+
 def get_terrain(terrain_dict, global_manager):
     """
     Takes terrain_dict as input with parametername: parametervalue for each parameter
     """
-    for current_terrain in global_manager.get("terrain_list"):
-        if current_terrain.in_bounds(terrain_dict):
-            return current_terrain
-    return "none"
+    terrain_key = tuple(
+        [
+            terrain_dict[current_parameter_type]
+            for current_parameter_type in global_manager.get("parameter_types")
+        ]
+    )
+    terrain_lookup_cache = global_manager.get("terrain_lookup_cache")
+    if terrain_key in terrain_lookup_cache:
+        return terrain_lookup_cache[terrain_key]
+
+    match_mask = get_terrain_match_mask(terrain_dict, global_manager)
+    if match_mask == 0:
+        return_value = "none"
+    else:
+        return_value = global_manager.get("terrain_list")[
+            (match_mask & -match_mask).bit_length() - 1
+        ]
+    terrain_lookup_cache[terrain_key] = return_value
+    return return_value
 
 
 def get_all_terrains(terrain_dict, global_manager):
     return_list = []
-    for current_terrain in global_manager.get("terrain_list"):
-        if current_terrain.in_bounds(terrain_dict):
-            return_list.append(current_terrain)
+    terrain_list = global_manager.get("terrain_list")
+    match_mask = get_terrain_match_mask(terrain_dict, global_manager)
+    while match_mask != 0:
+        lowest_bit = match_mask & -match_mask
+        return_list.append(terrain_list[lowest_bit.bit_length() - 1])
+        match_mask ^= lowest_bit
     return return_list
 
 
@@ -57,17 +134,15 @@ def create_terrain(global_manager, parameter_dict={}):
     while get_terrain_by_name(f"default{counter}", global_manager) != "none":
         counter += 1
     input_dict["name"] = f"default{counter}"
+    parameter_bound_keys = global_manager.get("parameter_bound_keys")
     for current_parameter_type in global_manager.get("parameter_types"):
+        min_key, max_key = parameter_bound_keys[current_parameter_type]
         if len(parameter_dict) == 0:
-            input_dict["min_" + current_parameter_type] = 1
-            input_dict["max_" + current_parameter_type] = 6
+            input_dict[min_key] = 1
+            input_dict[max_key] = 6
         else:  # can take point parameter_dict as input and set min and max values to the point values
-            input_dict["min_" + current_parameter_type] = parameter_dict[
-                current_parameter_type
-            ]
-            input_dict["max_" + current_parameter_type] = parameter_dict[
-                current_parameter_type
-            ]
+            input_dict[min_key] = parameter_dict[current_parameter_type]
+            input_dict[max_key] = parameter_dict[current_parameter_type]
     return global_manager.get("actor_creation_manager").create(
         input_dict, global_manager
     )
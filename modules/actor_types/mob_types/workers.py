@@ -42,14 +42,15 @@ class worker(pmob):
         self.is_worker = True
         self.is_church_volunteers = False
         self.worker_type = input_dict["worker_type"]  # European, religious
-        status.worker_types[self.worker_type].number += 1
+        self.worker_type_template = status.worker_types[self.worker_type]
+        self.worker_type_template.number += 1
         if not from_save:
-            status.worker_types[self.worker_type].on_recruit()
+            self.worker_type_template.on_recruit()
         self.set_controlling_minister_type(constants.type_minister_dict["production"])
 
         if not from_save:
             self.second_image_variant = random.randrange(0, len(self.image_variants))
-        constants.money_label.check_for_updates()
+        constants.money_label.schedule_update()
         self.finish_init(original_constructor, from_save, input_dict)
 
     def finish_init(
@@ -81,9 +82,22 @@ class worker(pmob):
             else:
                 self.image_dict["left portrait"] = input_dict.get("left portrait", [])
                 self.image_dict["right portrait"] = input_dict.get("right portrait", [])
+            self.left_portrait_image_id_list = (
+                actor_utility.generate_unit_component_portrait(
+                    self.image_dict["left portrait"], "left"
+                )
+            )  # portraits don't change after creation, so their frame positions only need to be calculated once
+            self.right_portrait_image_id_list = (
+                actor_utility.generate_unit_component_portrait(
+                    self.image_dict["right portrait"], "right"
+                )
+            )
             super().finish_init(original_constructor, from_save, input_dict)
-            self.image_dict["portrait"] = []
-            self.update_image_bundle()
+            if (
+                self.image_dict["portrait"] != []
+            ):  # Workers show left/right portraits instead - only rebuild the image bundle if super().finish_init built it with a single portrait
+                self.image_dict["portrait"] = []
+                self.update_image_bundle()
 
             if not from_save:
                 if ("select_on_creation" in input_dict) and input_dict[
@@ -114,8 +128,8 @@ class worker(pmob):
         destination_message = (
             f" for the {destination.name} at ({destination.x}, {destination.y})"
         )
-        status.worker_types[self.worker_type].on_recruit(purchased=True)
-        if not self.worker_type in ["religious"]:
+        self.worker_type_template.on_recruit(purchased=True)
+        if self.worker_type != "religious":
             text_utility.print_to_screen(
                 f"Replacement {self.worker_type} workers have been automatically hired{destination_message}."
             )
@@ -151,7 +165,7 @@ class worker(pmob):
             None
         """
         super().fire()
-        status.worker_types[self.worker_type].on_fire(wander=wander)
+        self.worker_type_template.on_fire(wander=wander)
 
     def can_show_tooltip(self):
         """
@@ -162,10 +176,7 @@ class worker(pmob):
         Output:
             None
         """
-        if not (self.in_group or self.in_vehicle):
-            return super().can_show_tooltip()
-        else:
-            return False
+        return not (self.in_group or self.in_vehicle) and super().can_show_tooltip()
 
     def crew_vehicle(self, vehicle):  # to do: make vehicle go to front of info display
         """
@@ -182,9 +193,11 @@ class worker(pmob):
         moved_mob = vehicle
         for current_image in moved_mob.images:  # moves vehicle to front
             if not current_image.current_cell == "none":
-                while not moved_mob == current_image.current_cell.contained_mobs[0]:
-                    current_image.current_cell.contained_mobs.append(
-                        current_image.current_cell.contained_mobs.pop(0)
+                contained_mobs = current_image.current_cell.contained_mobs
+                moved_index = contained_mobs.index(moved_mob)
+                if moved_index > 0:  # rotates in place, since equivalent cells share the same list
+                    contained_mobs[:] = (
+                        contained_mobs[moved_index:] + contained_mobs[:moved_index]
                     )
         self.remove_from_turn_queue()
         vehicle.add_to_turn_queue()
@@ -266,8 +279,8 @@ class worker(pmob):
             None
         """
         super().remove()
-        status.worker_types[self.worker_type].number -= 1
-        constants.money_label.check_for_updates()
+        self.worker_type_template.number -= 1
+        constants.money_label.schedule_update()
 
     def image_variants_setup(self, from_save, input_dict):
         """
@@ -302,14 +315,12 @@ class worker(pmob):
             list: Returns list of string image file paths, possibly combined with string key dictionaries with extra information for offset images
         """
         image_id_list = super().get_image_id_list(override_values)
-        if self.image_dict["default"] in image_id_list:
-            image_id_list.remove(self.image_dict["default"])
-        image_id_list += actor_utility.generate_unit_component_portrait(
-            self.image_dict["left portrait"], "left"
-        )
-        image_id_list += actor_utility.generate_unit_component_portrait(
-            self.image_dict["right portrait"], "right"
-        )
+        if (
+            image_id_list and image_id_list[0] == self.image_dict["default"]
+        ):  # actor.get_image_id_list always puts the default image first
+            del image_id_list[0]
+        image_id_list += self.left_portrait_image_id_list
+        image_id_list += self.right_portrait_image_id_list
         return image_id_list
 
     def get_worker(self) -> "pmob":
@@ -2,6 +2,7 @@
 
 import pygame
 import random
+import collections
 from ..constructs import images
 from ..util import utility, actor_utility, main_loop_utility
 from .actors import actor
@@ -34,13 +35,27 @@ class tile(actor):  # to do: make terrain tiles a subclass
         self.actor_type = "tile"
         self.selection_outline_color = "yellow"  #'bright blue'
         self.actor_match_outline_color = "white"
+        self.selection_outline_rgb = constants.color_dict[
+            self.selection_outline_color
+        ]
+        self.actor_match_outline_rgb = constants.color_dict[
+            self.actor_match_outline_color
+        ]
         input_dict["grids"] = [
             input_dict["grid"]
         ]  # give actor a 1-item list of grids as input
         self.name_icon = None
+        self.name_icon_key = None
+        self.terrain_image_id_list = []
+        self.terrain_image_id_key = None
+        self.equivalent_tiles = []
+        self.equivalent_tiles_key = None
+        self.tooltip_message = []
+        self.tooltip_key = None
         super().__init__(from_save, input_dict, original_constructor=False)
         self.set_name(input_dict["name"])
         self.image_dict = {"default": input_dict["image"]}
+        self.terrain_layer_dict = self.generate_terrain_layer_dict()
         self.image = images.tile_image(
             self,
             self.grid.get_cell_width(),
@@ -57,6 +72,9 @@ class tile(actor):  # to do: make terrain tiles a subclass
         if self.show_terrain:
             self.cell.tile = self
             self.image_dict["hidden"] = "terrains/paper_hidden.png"
+            self.set_resource(
+                self.cell.terrain_handler.resource, update_image_bundle=False
+            )
             self.set_terrain(
                 self.cell.terrain_handler.terrain
             )  # terrain is a property of the cell, being stored information rather than appearance, same for resource, set these in cell
@@ -73,23 +91,18 @@ class tile(actor):  # to do: make terrain tiles a subclass
             ):  # Earth should be able to hold commodities despite not being terrain
                 self.infinite_inventory_capacity = True
                 if constants.effect_manager.effect_active("infinite_commodities"):
-                    for current_commodity in constants.commodity_types:
-                        self.inventory[current_commodity] = 10
+                    self.inventory.update(constants.infinite_commodities_inventory)
         else:
             self.terrain = "none"
         self.finish_init(original_constructor, from_save, input_dict)
         if (
             self.name == "default"
         ):  # Set tile name to that of any terrain features, if applicable
-            for terrain_feature in self.cell.terrain_handler.terrain_features:
-                if self.cell.terrain_handler.terrain_features[terrain_feature].get(
-                    "name", False
-                ):
-                    self.set_name(
-                        self.cell.terrain_handler.terrain_features[terrain_feature][
-                            "name"
-                        ]
-                    )
+            for (
+                terrain_feature_dict
+            ) in self.cell.terrain_handler.terrain_features.values():
+                if terrain_feature_dict.get("name", False):
+                    self.set_name(terrain_feature_dict["name"])
 
     def set_name(self, new_name):
         """
@@ -105,21 +118,23 @@ class tile(actor):  # to do: make terrain tiles a subclass
             "default",
             "placeholder",
         ]:  # make sure user is not allowed to input default or *.png as a tile name
-            if self.name_icon:
-                self.name_icon.remove_complete()
-
             y_offset = -0.75
-            has_building = False
-            for building_type in constants.building_types:
-                if (
-                    self.cell.has_building(building_type)
-                    and building_type != "infrastructure"
-                ):  # if any building present, shift name up to not cover them
-                    has_building = True
-                    break
-            if has_building:
+            if any(
+                current_building != "none"
+                for building_type, current_building in self.cell.contained_buildings.items()
+                if building_type != "infrastructure"
+            ):  # if any building present, shift name up to not cover them
                 y_offset += 0.3
 
+            if self.name_icon:
+                if (
+                    new_name,
+                    y_offset,
+                ) == self.name_icon_key:  # existing name icon already looks correct
+                    return
+                self.name_icon.remove_complete()
+
+            self.name_icon_key = (new_name, y_offset)
             self.name_icon = constants.actor_creation_manager.create(
                 False,
                 {
@@ -156,21 +171,21 @@ class tile(actor):  # to do: make terrain tiles a subclass
         Output:
             None
         """
+        if color == "default":
+            outline_rgb = self.selection_outline_rgb
+        else:
+            outline_rgb = constants.color_dict[
+                color
+            ]  # converts input string to RGB tuple
         for current_image in self.images:
             if current_image.can_show():
-                outline = self.cell.Rect
-                if color == "default":
-                    color = constants.color_dict[self.selection_outline_color]
-                else:
-                    color = constants.color_dict[
-                        color
-                    ]  # converts input string to RGB tuple
                 pygame.draw.rect(
                     constants.game_display,
-                    color,
-                    (outline),
+                    outline_rgb,
+                    self.cell.Rect,
                     current_image.outline_width,
                 )
+                break  # all of a tile's images share its cell's outline, so only draw it once
 
     def draw_actor_match_outline(self, recursive=False):
         """
@@ -183,14 +198,12 @@ class tile(actor):  # to do: make terrain tiles a subclass
             None
         """
         if self.images[0].can_show():
-            for current_image in self.images:
-                outline = self.cell.Rect
-                pygame.draw.rect(
-                    constants.game_display,
-                    constants.color_dict[self.actor_match_outline_color],
-                    (outline),
-                    current_image.outline_width,
-                )
+            pygame.draw.rect(
+                constants.game_display,
+                self.actor_match_outline_rgb,
+                self.cell.Rect,
+                self.images[0].outline_width,
+            )  # all of a tile's images share its cell's outline, so only draw it once
         if not recursive:
             for tile in self.get_equivalent_tiles():
                 tile.draw_actor_match_outline(recursive=True)
@@ -209,12 +222,18 @@ class tile(actor):  # to do: make terrain tiles a subclass
             amount_to_remove = inventory_used - self.inventory_capacity
             if amount_to_remove > 0:
                 commodity_types = self.get_held_commodities()
-                amount_removed = 0
-                while amount_removed < amount_to_remove:
-                    commodity_removed = random.choice(commodity_types)
-                    if self.get_inventory(commodity_removed) > 0:
-                        self.change_inventory(commodity_removed, -1)
-                        amount_removed += 1
+                removed_commodities = collections.Counter(
+                    random.sample(
+                        commodity_types,
+                        amount_to_remove,
+                        counts=[
+                            self.get_inventory(current_commodity)
+                            for current_commodity in commodity_types
+                        ],
+                    )
+                )  # draws every removed unit at once, each held commodity unit being equally likely to be removed
+                for commodity_removed, amount_removed in removed_commodities.items():
+                    self.change_inventory(commodity_removed, -1 * amount_removed)
 
     def set_inventory(self, commodity, new_value):
         """
@@ -226,6 +245,10 @@ class tile(actor):  # to do: make terrain tiles a subclass
         Output:
             None
         """
+        if (
+            self.inventory.get(commodity, 0) == new_value
+        ):  # no need to update equivalent tiles or the info display if nothing changed
+            return
         super().set_inventory(commodity, new_value)
         equivalent_tiles = self.get_equivalent_tiles()
         for tile in equivalent_tiles:
@@ -256,17 +279,42 @@ class tile(actor):  # to do: make terrain tiles a subclass
         Output:
             tile: tile on the corresponding tile on the grid attached to this tile's grid
         """
+        if self.grid == status.strategic_map_grid:
+            equivalent_tiles_key = tuple(
+                [
+                    (mini_grid.center_x, mini_grid.center_y)
+                    for mini_grid in self.grid.mini_grids
+                ]
+            )
+        elif self.grid.is_mini_grid:
+            equivalent_tiles_key = (self.grid.center_x, self.grid.center_y)
+        else:
+            return []
+        if (
+            equivalent_tiles_key == self.equivalent_tiles_key
+        ):  # equivalent tiles only change when a mini grid is centered somewhere else
+            return self.equivalent_tiles
+
         return_list = []
+        is_complete = True
         if self.grid == status.strategic_map_grid:
             for mini_grid in self.grid.mini_grids:
                 mini_x, mini_y = mini_grid.get_mini_grid_coordinates(self.x, self.y)
                 equivalent_cell = mini_grid.find_cell(mini_x, mini_y)
                 if equivalent_cell and equivalent_cell.tile != "none":
                     return_list.append(equivalent_cell.tile)
-        elif self.grid.is_mini_grid:
+                else:
+                    is_complete = False
+        else:
             main_x, main_y = self.grid.get_main_grid_coordinates(self.x, self.y)
             equivalent_cell = self.grid.attached_grid.find_cell(main_x, main_y)
             return_list.append(equivalent_cell.tile)
+            is_complete = equivalent_cell.tile != "none"
+        if (
+            is_complete
+        ):  # don't remember results from before all grids' tiles have been created
+            self.equivalent_tiles = return_list
+            self.equivalent_tiles_key = equivalent_tiles_key
         return return_list
 
     # maybe make these into general actor functions? override update image bundle for tile to account for resources/buildings, have group version with multiple entities
@@ -281,77 +329,114 @@ class tile(actor):  # to do: make terrain tiles a subclass
             list: Returns list of string image file paths, possibly combined with string key dictionaries with extra information for offset images
         """
         image_id_list = []
-        if constants.current_map_mode == "terrain":
-            if self.cell.grid.is_mini_grid:
+        current_map_mode = constants.current_map_mode
+        cell = self.cell
+        terrain_handler = cell.terrain_handler
+        if current_map_mode == "terrain":
+            if cell.grid.is_mini_grid:
                 equivalent_tiles = self.get_equivalent_tiles()
                 if equivalent_tiles and self.show_terrain:
                     image_id_list = equivalent_tiles[0].get_image_id_list()
-            elif self.cell.grid == status.earth_grid:
+            elif cell.grid == status.earth_grid:
                 image_id_list = []
             else:
                 if (
-                    self.cell.terrain_handler.visible or force_visibility
+                    terrain_handler.visible or force_visibility
                 ):  # force visibility shows full tile even if tile is not yet visible
-                    image_id_list.append(
-                        {
-                            "image_id": self.image_dict["default"],
-                            "size": 1,
-                            "x_offset": 0,
-                            "y_offset": 0,
-                            "level": -9,
-                        }
+                    contained_buildings = cell.get_buildings()
+                    terrain_image_id_key = (
+                        self.image_dict["default"],
+                        terrain_handler.resource,
+                        tuple(terrain_handler.terrain_features),
+                        bool(contained_buildings),
                     )
-                    for terrain_feature in self.cell.terrain_handler.terrain_features:
-                        new_image_id = self.cell.terrain_handler.terrain_features[
-                            terrain_feature
-                        ].get(
-                            "image_id",
-                            status.terrain_feature_types[terrain_feature].image_id,
+                    if (
+                        terrain_image_id_key != self.terrain_image_id_key
+                    ):  # terrain, feature, and resource images only need to be regenerated when they would look different
+                        self.terrain_image_id_list = (
+                            self.generate_terrain_image_id_list()
                         )
-                        if type(new_image_id) == str and not new_image_id.endswith(
-                            ".png"
-                        ):
-                            new_image_id = actor_utility.generate_label_image_id(
-                                new_image_id, y_offset=-0.75
-                            )
-                        image_id_list = utility.combine(image_id_list, new_image_id)
-                    if self.cell.terrain_handler.resource != "none":
-                        resource_icon = actor_utility.generate_resource_icon(self)
-                        if type(resource_icon) == str:
-                            image_id_list.append(resource_icon)
-                        else:
-                            image_id_list += resource_icon
-                    for current_building_type in constants.building_types:
-                        current_building = self.cell.get_building(current_building_type)
-                        if current_building != "none":
-                            image_id_list += current_building.get_image_id_list()
+                        self.terrain_image_id_key = terrain_image_id_key
+                    image_id_list = self.terrain_image_id_list.copy()
+                    for current_building in contained_buildings:
+                        image_id_list += current_building.get_image_id_list()
                 elif self.show_terrain:
                     image_id_list.append(self.image_dict["hidden"])
                 else:
                     image_id_list.append(self.image_dict["default"])
                 for current_image in self.hosted_images:
                     image_id_list += current_image.get_image_id_list()
-        elif constants.current_map_mode in constants.terrain_parameters:
-            if constants.current_map_mode in ["water", "temperature", "vegetation"]:
-                image_id_list.append(
-                    f"misc/map_modes/{constants.current_map_mode}/{self.cell.get_parameter(constants.current_map_mode)}.png"
-                )
-            else:
-                image_id_list.append(
-                    f"misc/map_modes/{self.cell.get_parameter(constants.current_map_mode)}.png"
-                )
-        elif constants.current_map_mode == "magnetic":
-            if self.cell.terrain_handler.terrain_features.get("equator", False):
+        elif current_map_mode in constants.terrain_parameters:
+            image_id_list.append(
+                constants.terrain_manager.map_mode_image_ids[current_map_mode][
+                    cell.get_parameter(current_map_mode)
+                ]
+            )
+        elif current_map_mode == "magnetic":
+            terrain_features = terrain_handler.terrain_features
+            if terrain_features.get("equator", False):
                 image_id_list.append("misc/map_modes/equator.png")
-            elif self.cell.terrain_handler.terrain_features.get("north pole", False):
+            elif terrain_features.get("north pole", False):
                 image_id_list.append("misc/map_modes/north_pole.png")
-            elif self.cell.terrain_handler.terrain_features.get("south pole", False):
+            elif terrain_features.get("south pole", False):
                 image_id_list.append("misc/map_modes/south_pole.png")
             else:
                 image_id_list.append("misc/map_modes/none.png")
 
         return image_id_list
 
+    def generate_terrain_image_id_list(self):
+        """
+        Description:
+            Generates and returns the terrain, terrain feature, and resource icon images of this tile's image id list, which only change when this tile's terrain,
+                terrain features, resource, or whether it has any buildings change
+        Input:
+            None
+        Output:
+            list: Returns list of string image file paths, possibly combined with string key dictionaries with extra information for offset images
+        """
+        image_id_list = [self.terrain_layer_dict]
+        terrain_feature_types = status.terrain_feature_types
+        for (
+            terrain_feature,
+            terrain_feature_dict,
+        ) in self.cell.terrain_handler.terrain_features.items():
+            new_image_id = terrain_feature_dict.get(
+                "image_id", terrain_feature_types[terrain_feature].image_id
+            )
+            if isinstance(new_image_id, str) and not new_image_id.endswith(".png"):
+                new_image_id = actor_utility.generate_label_image_id(
+                    new_image_id, y_offset=-0.75
+                )
+            if isinstance(new_image_id, list):
+                image_id_list.extend(new_image_id)
+            else:
+                image_id_list.append(new_image_id)
+        if self.cell.terrain_handler.resource != "none":
+            resource_icon = actor_utility.generate_resource_icon(self)
+            if isinstance(resource_icon, str):
+                image_id_list.append(resource_icon)
+            else:
+                image_id_list += resource_icon
+        return image_id_list
+
+    def generate_terrain_layer_dict(self):
+        """
+        Description:
+            Generates and returns the image id dictionary of this tile's base terrain layer, which is reused until this tile's terrain changes
+        Input:
+            None
+        Output:
+            dictionary: Returns image id dictionary of this tile's base terrain layer
+        """
+        return {
+            "image_id": self.image_dict["default"],
+            "size": 1,
+            "x_offset": 0,
+            "y_offset": 0,
+            "level": -9,
+        }
+
     def update_image_bundle(self, override_image=None):
         """
         Description:
@@ -363,12 +448,22 @@ class tile(actor):  # to do: make terrain tiles a subclass
             None
         """
         if override_image:
-            self.set_image(override_image)
+            new_image = override_image
         else:
-            self.set_image(self.get_image_id_list())
+            new_image = self.get_image_id_list()
+        self.set_image(new_image)
         if self.grid == status.strategic_map_grid:
             for equivalent_tile in self.get_equivalent_tiles():
-                equivalent_tile.update_image_bundle(override_image=override_image)
+                if not equivalent_tile.grid.is_on_mini_grid(
+                    self.x, self.y
+                ):  # wrapped coordinates of tiles off the minimap would point to a minimap tile showing a different tile
+                    continue
+                if equivalent_tile.show_terrain:
+                    equivalent_tile.set_image(
+                        new_image
+                    )  # minimap terrain tiles show the same images as their strategic map tile, so reuse this tile's image id list rather than generating it again
+                else:
+                    equivalent_tile.update_image_bundle(override_image=override_image)
 
     def set_resource(self, new_resource, update_image_bundle=True):
         """
@@ -381,6 +476,7 @@ class tile(actor):  # to do: make terrain tiles a subclass
             None
         """
         self.resource = new_resource
+        self.resource_tooltip_text = f"This tile has {utility.generate_article(new_resource)} {new_resource} resource"
         if update_image_bundle:
             self.update_image_bundle()
 
@@ -406,6 +502,8 @@ class tile(actor):  # to do: make terrain tiles a subclass
             )
         elif new_terrain == "none":
             self.image_dict["default"] = "terrains/hidden.png"
+        self.terrain_tooltip_text = f"This is {utility.generate_article(new_terrain.replace('_', ''))} {new_terrain.replace('_', ' ')} tile"
+        self.terrain_layer_dict = self.generate_terrain_layer_dict()
         if update_image_bundle:
             self.update_image_bundle()
 
@@ -420,8 +518,22 @@ class tile(actor):  # to do: make terrain tiles a subclass
             None
         """
         if self.show_terrain:  # if is terrain, show tooltip
-            tooltip_message = []
             coordinates = self.get_main_grid_coordinates()
+            terrain_handler = self.cell.terrain_handler
+            tooltip_key = (
+                coordinates,
+                terrain_handler.visible,
+                terrain_handler.terrain,
+                terrain_handler.resource,
+                tuple(terrain_handler.terrain_parameters.values()),
+                tuple(terrain_handler.terrain_features),
+            )
+            if (
+                tooltip_key == self.tooltip_key
+                and self.tooltip_text is self.tooltip_message
+            ):  # tooltip is already set to a message for this tile's current state
+                return
+            tooltip_message = []
             tooltip_message.append(
                 "Coordinates: ("
                 + str(coordinates[0])
@@ -429,28 +541,30 @@ class tile(actor):  # to do: make terrain tiles a subclass
                 + str(coordinates[1])
                 + ")"
             )
-            if self.cell.terrain_handler.visible:
-                if self.cell.terrain_handler.terrain != "none":
-                    tooltip_message.append(
-                        f"This is {utility.generate_article(self.cell.terrain_handler.terrain.replace('_', '' ''))} {self.cell.terrain_handler.terrain.replace('_', ' ')} tile"
+            if terrain_handler.visible:
+                if terrain_handler.terrain != "none":
+                    tooltip_message.append(self.terrain_tooltip_text)
+                    terrain_parameter_keywords = (
+                        constants.terrain_manager.terrain_parameter_keywords
                     )
+                    maxima = terrain_handler.maxima
                     for terrain_parameter in constants.terrain_parameters:
                         value = self.cell.get_parameter(terrain_parameter)
                         tooltip_message.append(
-                            f"    {terrain_parameter}: {constants.terrain_manager.terrain_parameter_keywords[terrain_parameter][value]} ({value}/{self.cell.terrain_handler.maxima.get(terrain_parameter, 6)})"
+                            f"    {terrain_parameter}: {terrain_parameter_keywords[terrain_parameter][value]} ({value}/{maxima.get(terrain_parameter, 6)})"
                         )
                 if (
-                    self.cell.terrain_handler.resource != "none"
+                    terrain_handler.resource != "none"
                 ):  # if resource present, show resource
-                    tooltip_message.append(
-                        f"This tile has {utility.generate_article(self.cell.terrain_handler.resource)} {self.cell.terrain_handler.resource} resource"
-                    )
-                for terrain_feature in self.cell.terrain_handler.terrain_features:
+                    tooltip_message.append(self.resource_tooltip_text)
+                for terrain_feature in terrain_handler.terrain_features:
                     tooltip_message.append(
                         f"This tile has {utility.generate_article(terrain_feature, add_space=True)}{terrain_feature}"
                     )
             else:
                 tooltip_message.append("This tile has not been explored")
+            self.tooltip_key = tooltip_key
+            self.tooltip_message = tooltip_message
             self.set_tooltip(tooltip_message)
         else:
             self.set_tooltip([])
@@ -467,6 +581,7 @@ class tile(actor):  # to do: make terrain tiles a subclass
         """
         self.x = x
         self.y = y
+        self.equivalent_tiles_key = None
 
     def can_show_tooltip(self):  # only terrain tiles have tooltips
         """
@@ -559,3 +674,17 @@ class abstract_tile(tile):
 
     def get_image_id_list(self):
         return self.grid_image_id
+
+    def update_image_bundle(self, override_image=None):
+        """
+        Description:
+            Updates this actor's images with its current image id list. An abstract tile's image never changes after initialization, so this only does anything when given
+                an image bundle to copy
+        Input:
+            image_bundle override_image=None: Image bundle to update image with, setting this tile's image to a copy of the image bundle instead of generating a new image
+                bundle
+        Output:
+            None
+        """
+        if override_image or self.image.image_id is not self.grid_image_id:
+            super().update_image_bundle(override_image=override_image)
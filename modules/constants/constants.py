@@ -458,6 +458,9 @@ commodity_types: List[str] = [
     "ivory",
     "rubber",
 ]
+infinite_commodities_inventory: Dict[str, int] = {
+    current_commodity: 10 for current_commodity in commodity_types
+}
 collectable_resources: List[str] = [
     "coffee",
     "copper",
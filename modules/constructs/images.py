@@ -162,7 +162,8 @@ class image_bundle(image):
         self.members = []
         if isinstance(image_id_list, list):
             for current_image_id in image_id_list:
-                self.add_member(current_image_id)
+                self.add_member(current_image_id, update_combined_surface=False)
+            self.combined_surface = self.generate_combined_surface()
         else:
             if image_id_list.contains_bundle:
                 image_id_list = image_id_list.image
@@ -197,13 +198,16 @@ class image_bundle(image):
         for member in self.members:
             member.scale()
 
-    def add_member(self, image_id, member_type="default"):
+    def add_member(
+        self, image_id, member_type="default", update_combined_surface=True
+    ):
         """
         Description:
             Adds a new member image to this bundle
         Input:
             string/dictionary image_id: String image file path or offset image dictionary that defines the member added
             string member_type = 'default': Optional string to designate this member's type, allowing it to be specifically removed or found based on type later
+            boolean update_combined_surface = True: Whether to regenerate the combined surface - if multiple members are being added, optimal to only generate it after the last one
         """
         if isinstance(image_id, str):
             new_member = bundle_image(self, image_id, member_type)
@@ -215,7 +219,8 @@ class image_bundle(image):
         ):  # inserts at back of same level
             index += 1
         self.members.insert(index, new_member)
-        self.combined_surface = self.generate_combined_surface()
+        if update_combined_surface:
+            self.combined_surface = self.generate_combined_surface()
 
     def get_blit_sequence(self):
         """
@@ -346,6 +351,29 @@ class bundle_image:
     Not a true image, just a width, height, and id for an image in a bundle
     """
 
+    __slots__ = (
+        "bundle",
+        "image",
+        "member_type",
+        "is_offset",
+        "image_id",
+        "image_id_dict",
+        "level",
+        "x_size",
+        "y_size",
+        "x_offset",
+        "y_offset",
+        "override_width",
+        "override_height",
+        "has_green_screen",
+        "green_screen_colors",
+        "font",
+        "free",
+        "text",
+        "width",
+        "height",
+    )  # optional attributes like override_width are left unset when not given, so hasattr checks still work
+
     def __init__(self, bundle, image_id, member_type, is_offset=False):
         """
         Description:
@@ -144,7 +144,7 @@ class worker_type:
         Output:
             None
         """
-        if not self.adjective in ["religious"]:
+        if self.adjective != "religious":
             market_utility.attempt_worker_upkeep_change("increase", self.adjective)
 
     def on_fire(self, wander=False):
@@ -156,7 +156,7 @@ class worker_type:
         Output:
             None
         """
-        if not self.adjective in ["religious"]:
+        if self.adjective != "religious":
             market_utility.attempt_worker_upkeep_change("decrease", self.adjective)
 
         if self.adjective in ["European", "religious"]:
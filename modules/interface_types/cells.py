@@ -332,13 +332,12 @@ class cell:
         Output:
             building list contained_buildings_list: buildings contained in this cell
         """
-        contained_buildings_list = []
-        for current_building_type in constants.building_types:
-            if self.has_building(current_building_type):
-                contained_buildings_list.append(
-                    self.contained_buildings[current_building_type]
-                )
-        return contained_buildings_list
+        contained_buildings = self.contained_buildings
+        return [
+            contained_buildings[current_building_type]
+            for current_building_type in constants.building_types
+            if contained_buildings[current_building_type] != "none"
+        ]  # reset_buildings gives every building type an entry, so there is no need to go through has_building's checks for non-building types
 
     def get_intact_buildings(self):
         """
@@ -752,13 +751,11 @@ class cell:
         Output:
             None
         """
-        current_color = self.color
-        red = current_color[0]
-        green = current_color[1]
-        blue = current_color[2]
-        if not self.terrain_handler.visible:
-            red, green, blue = constants.color_dict["blonde"]
-        pygame.draw.rect(constants.game_display, (red, green, blue), self.Rect)
+        if self.terrain_handler.visible:
+            current_color = self.color
+        else:
+            current_color = constants.color_dict["blonde"]
+        pygame.draw.rect(constants.game_display, current_color, self.Rect)
         if self.tile != "none":
             for current_image in self.tile.images:
                 current_image.draw()
@@ -813,27 +810,13 @@ class cell:
         Output:
             None
         """
-        adjacent_list = []
-
-        adjacent_cell = self.grid.find_cell(
-            (self.x - 1) % self.grid.coordinate_width, self.y
-        )
-        adjacent_list.append(adjacent_cell)
-        self.adjacent_cells["left"] = adjacent_cell
-        adjacent_cell = self.grid.find_cell(
-            (self.x + 1) % self.grid.coordinate_width, self.y
-        )
-        adjacent_list.append(adjacent_cell)
-        self.adjacent_cells["right"] = adjacent_cell
-        adjacent_cell = self.grid.find_cell(
-            self.x, (self.y - 1) % self.grid.coordinate_height
-        )
-        adjacent_list.append(adjacent_cell)
-        self.adjacent_cells["down"] = adjacent_cell
-        adjacent_cell = self.grid.find_cell(
-            self.x, (self.y + 1) % self.grid.coordinate_height
-        )
-        adjacent_list.append(adjacent_cell)
-        self.adjacent_cells["up"] = adjacent_cell
-
-        self.adjacent_list = adjacent_list
+        cell_list = self.grid.cell_list
+        left_cell = cell_list[(self.x - 1) % self.grid.coordinate_width][self.y]
+        right_cell = cell_list[(self.x + 1) % self.grid.coordinate_width][self.y]
+        down_cell = cell_list[self.x][(self.y - 1) % self.grid.coordinate_height]
+        up_cell = cell_list[self.x][(self.y + 1) % self.grid.coordinate_height]
+        self.adjacent_cells["left"] = left_cell
+        self.adjacent_cells["right"] = right_cell
+        self.adjacent_cells["down"] = down_cell
+        self.adjacent_cells["up"] = up_cell
+        self.adjacent_list = [left_cell, right_cell, down_cell, up_cell]
@@ -3,9 +3,9 @@
 import random
 import pygame
 import itertools
-from typing import Dict, List
+from typing import Dict, Tuple
 from . import cells, interface_elements
-from ..util import actor_utility, utility
+from ..util import actor_utility, drawing_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 import modules.constants.flags as flags
@@ -37,6 +37,8 @@ class grid(interface_elements.interface_element):
         Output:
             None
         """
+        self.pixel_x_dict = None
+        self.pixel_y_dict = None
         super().__init__(input_dict)
         status.grid_list.append(self)
         self.grid_type = input_dict["grid_type"]
@@ -44,6 +46,9 @@ class grid(interface_elements.interface_element):
         self.from_save = from_save
         self.is_mini_grid = False
         self.is_abstract_grid = False
+        self.is_scrolling_strategic_map_grid = (
+            self.grid_type == "scrolling_strategic_map_grid"
+        )
         self.attached_grid = "none"
         self.coordinate_width: int = input_dict.get(
             "coordinate_size", input_dict.get("coordinate_width")
@@ -52,13 +57,24 @@ class grid(interface_elements.interface_element):
             "coordinate_size", input_dict.get("coordinate_height")
         )
         self.area: int = self.coordinate_width * self.coordinate_height
+        self.update_pixel_coordinates()
         self.internal_line_color = input_dict.get("internal_line_color", "black")
         self.external_line_color = input_dict.get("external_line_color", "dark gray")
+        self.internal_line_rgb = constants.color_dict[self.internal_line_color]
+        self.external_line_rgb = constants.color_dict[self.external_line_color]
         self.mini_grids = []
+        self.grid_lines_surface = None
+        self.grid_lines_origin = (0, 0)
+        self.grid_lines_key = None
+        self.minimap_outline_points = None
+        self.minimap_outline_key = None
+        self.map_image = None
+        self.map_image_key = None
         self.cell_list = [
             [None] * self.coordinate_height for y in range(self.coordinate_width)
         ]
         # printed list would be inverted - each row corresponds to an x value and each column corresponds to a y value, but can be indexed by cell_list[x][y]
+        self.flat_cell_list = ()
         if (
             not from_save
         ):  # terrain created after grid initialization by create_strategic_map in game_transitions
@@ -75,9 +91,11 @@ class grid(interface_elements.interface_element):
         Output:
             None
         """
+        cell_size = (self.get_cell_width(), self.get_cell_height())
         for current_cell_dict in cell_list:
             x, y = current_cell_dict["coordinates"]
-            self.create_cell(x, y, save_dict=current_cell_dict)
+            self.create_cell(x, y, save_dict=current_cell_dict, cell_size=cell_size)
+        self.flat_cell_list = tuple(itertools.chain.from_iterable(self.cell_list))
         for current_cell in self.get_flat_cell_list():
             current_cell.find_adjacent_cells()
 
@@ -90,24 +108,35 @@ class grid(interface_elements.interface_element):
         Output:
             List: List of images representing this grid - approximation of very zoomed out grid
         """
-        return_list = [{"image_id": "misc/lines.png", "level": 10}]
+        image_ids = []
         for current_cell in self.get_flat_cell_list():
             image_id = current_cell.tile.get_image_id_list()[0]
-            if type(image_id) == dict:
+            if isinstance(image_id, dict):
                 image_id = image_id["image_id"]
+            image_ids.append(image_id)
+        image_ids = tuple(image_ids)
+        if (
+            image_ids == self.map_image_key
+        ):  # returning the same list lets the map image skip regenerating its bundle
+            return self.map_image
+
+        x_size = 1.05 / self.coordinate_width
+        y_size = 1.05 / self.coordinate_height
+        x_shift = (0.7 / self.coordinate_width) - 0.5
+        y_shift = (0.4 / self.coordinate_height) - 0.5
+        return_list = [{"image_id": "misc/lines.png", "level": 10}]
+        for current_cell, image_id in zip(self.get_flat_cell_list(), image_ids):
             return_list.append(
                 {
                     "image_id": image_id,
-                    "x_offset": (current_cell.x) / self.coordinate_width
-                    - 0.5
-                    + (0.7 / self.coordinate_width),
-                    "y_offset": (current_cell.y) / self.coordinate_height
-                    - 0.5
-                    + (0.4 / self.coordinate_height),
-                    "x_size": 1.05 / self.coordinate_width,
-                    "y_size": 1.05 / self.coordinate_height,
+                    "x_offset": current_cell.x / self.coordinate_width + x_shift,
+                    "y_offset": current_cell.y / self.coordinate_height + y_shift,
+                    "x_size": x_size,
+                    "y_size": y_size,
                 }
             )
+        self.map_image = return_list
+        self.map_image_key = image_ids
         return return_list
 
     def to_save_dict(self):
@@ -133,12 +162,14 @@ class grid(interface_elements.interface_element):
     def draw(self):
         """
         Description:
-            Draws each cell of this grid
+            Draws each cell of this grid, unless this grid is entirely off the screen
         Input:
             None
         Output:
             None
         """
+        if not self.Rect.colliderect(constants.game_display.get_rect()):
+            return
         for cell in self.get_flat_cell_list():
             cell.draw()
         self.draw_grid_lines()
@@ -152,127 +183,169 @@ class grid(interface_elements.interface_element):
         Output:
             None
         """
-        if flags.show_grid_lines:
-            for x in range(0, self.coordinate_width + 1):
-                pygame.draw.line(
-                    constants.game_display,
-                    constants.color_dict[self.internal_line_color],
-                    self.convert_coordinates((x, 0)),
-                    self.convert_coordinates((x, self.coordinate_height)),
-                    self.grid_line_width,
-                )
-            for y in range(0, self.coordinate_height + 1):
-                pygame.draw.line(
-                    constants.game_display,
-                    constants.color_dict[self.internal_line_color],
-                    self.convert_coordinates((0, y)),
-                    self.convert_coordinates((self.coordinate_width, y)),
-                    self.grid_line_width,
-                )
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((0, 0)),
-            self.convert_coordinates((0, self.coordinate_height)),
-            self.grid_line_width + 1,
-        )
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((self.coordinate_width, 0)),
-            self.convert_coordinates((self.coordinate_width, self.coordinate_height)),
-            self.grid_line_width + 1,
+        grid_lines_key = (
+            flags.show_grid_lines,
+            self.x,
+            self.y,
+            self.width,
+            self.height,
+            constants.display_height,
         )
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((0, 0)),
-            self.convert_coordinates((self.coordinate_width, 0)),
-            self.grid_line_width + 1,
-        )
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((0, self.coordinate_height)),
-            self.convert_coordinates((self.coordinate_width, self.coordinate_height)),
-            self.grid_line_width + 1,
+        if (
+            grid_lines_key != self.grid_lines_key
+        ):  # cell and outside lines only need to be redrawn if this grid moves or grid lines are toggled
+            self.grid_lines_surface, self.grid_lines_origin = (
+                self.generate_grid_lines_surface()
+            )
+            self.grid_lines_key = grid_lines_key
+        drawing_utility.display_image(
+            self.grid_lines_surface,
+            self.grid_lines_origin[0],
+            self.grid_lines_origin[1],
         )
         if (
-            self.mini_grids or self == status.scrolling_strategic_map_grid
+            self.mini_grids or self.is_scrolling_strategic_map_grid
         ) and flags.show_minimap_outlines:
-            mini_map_outline_color = status.minimap_grid.external_line_color
-            if self == status.scrolling_strategic_map_grid:
-                left_x = (
-                    self.coordinate_width // 2
-                    - status.minimap_grid.coordinate_width // 2
-                )
-                right_x = (
-                    self.coordinate_width // 2
-                    + status.minimap_grid.coordinate_width // 2
-                    + 1
-                )
-                down_y = (
-                    self.coordinate_height // 2
-                    - status.minimap_grid.coordinate_height // 2
-                )
-                up_y = (
-                    self.coordinate_height // 2
-                    + status.minimap_grid.coordinate_height // 2
-                    + 1
-                )
-            else:
-                left_x = status.minimap_grid.center_x - (
-                    (status.minimap_grid.coordinate_width - 1) / 2
-                )
-                right_x = (
-                    status.minimap_grid.center_x
-                    + ((status.minimap_grid.coordinate_width - 1) / 2)
-                    + 1
-                )
-                down_y = status.minimap_grid.center_y - (
-                    (status.minimap_grid.coordinate_height - 1) / 2
-                )
-                up_y = (
-                    status.minimap_grid.center_y
-                    + ((status.minimap_grid.coordinate_height - 1) / 2)
-                    + 1
-                )
-                if right_x > self.coordinate_width:
-                    right_x = self.coordinate_width
-                if left_x < 0:
-                    left_x = 0
-                if up_y > self.coordinate_height:
-                    up_y = self.coordinate_height
-                if down_y < 0:
-                    down_y = 0
-            pygame.draw.line(
-                constants.game_display,
-                constants.color_dict[mini_map_outline_color],
-                self.convert_coordinates((left_x, down_y)),
-                self.convert_coordinates((left_x, up_y)),
-                self.grid_line_width + 1,
+            minimap_outline_key = (
+                status.minimap_grid.center_x,
+                status.minimap_grid.center_y,
+                grid_lines_key,
             )
-            pygame.draw.line(
+            if (
+                minimap_outline_key != self.minimap_outline_key
+            ):  # outline only moves when the minimap is recentered or this grid moves
+                self.minimap_outline_points = self.generate_minimap_outline_points()
+                self.minimap_outline_key = minimap_outline_key
+            pygame.draw.lines(
                 constants.game_display,
-                constants.color_dict[mini_map_outline_color],
-                self.convert_coordinates((left_x, up_y)),
-                self.convert_coordinates((right_x, up_y)),
+                status.minimap_grid.external_line_rgb,
+                True,
+                self.minimap_outline_points,
                 self.grid_line_width + 1,
+            )  # outline is drawn as one closed polyline instead of 4 separate lines
+
+    def generate_minimap_outline_points(self):
+        """
+        Description:
+            Finds the pixel coordinates of the corners of the area on this grid covered by the minimap grid
+        Input:
+            None
+        Output:
+            int tuple list: Returns the pixel coordinates of the outline's corners, in drawing order
+        """
+        if self.is_scrolling_strategic_map_grid:
+            left_x = (
+                self.coordinate_width // 2 - status.minimap_grid.coordinate_width // 2
             )
-            pygame.draw.line(
-                constants.game_display,
-                constants.color_dict[mini_map_outline_color],
-                self.convert_coordinates((right_x, up_y)),
-                self.convert_coordinates((right_x, down_y)),
-                self.grid_line_width + 1,
+            right_x = (
+                self.coordinate_width // 2
+                + status.minimap_grid.coordinate_width // 2
+                + 1
             )
-            pygame.draw.line(
-                constants.game_display,
-                constants.color_dict[mini_map_outline_color],
-                self.convert_coordinates((right_x, down_y)),
-                self.convert_coordinates((left_x, down_y)),
-                self.grid_line_width + 1,
+            down_y = (
+                self.coordinate_height // 2
+                - status.minimap_grid.coordinate_height // 2
+            )
+            up_y = (
+                self.coordinate_height // 2
+                + status.minimap_grid.coordinate_height // 2
+                + 1
+            )
+        else:
+            left_x = max(
+                status.minimap_grid.center_x
+                - ((status.minimap_grid.coordinate_width - 1) / 2),
+                0,
+            )
+            right_x = min(
+                status.minimap_grid.center_x
+                + ((status.minimap_grid.coordinate_width - 1) / 2)
+                + 1,
+                self.coordinate_width,
+            )
+            down_y = max(
+                status.minimap_grid.center_y
+                - ((status.minimap_grid.coordinate_height - 1) / 2),
+                0,
+            )
+            up_y = min(
+                status.minimap_grid.center_y
+                + ((status.minimap_grid.coordinate_height - 1) / 2)
+                + 1,
+                self.coordinate_height,
             )
+        return [
+            self.convert_coordinates((left_x, down_y)),
+            self.convert_coordinates((left_x, up_y)),
+            self.convert_coordinates((right_x, up_y)),
+            self.convert_coordinates((right_x, down_y)),
+        ]
+
+    def generate_grid_lines_surface(self):
+        """
+        Description:
+            Draws this grid's lines between cells, if shown, and its lines on the outside of the grid onto a transparent surface that can be drawn with one blit per frame
+        Input:
+            None
+        Output:
+            pygame.Surface: Returns a surface containing this grid's lines
+            int tuple: Returns two values representing x and y pixel coordinates at which to draw the surface
+        """
+        padding = self.grid_line_width + 2  # lines can extend past the grid's edges
+        left_x, top_y = self.convert_coordinates((0, self.coordinate_height))
+        right_x, bottom_y = self.convert_coordinates((self.coordinate_width, 0))
+        origin_x, origin_y = (left_x - padding, top_y - padding)
+        grid_lines_surface = pygame.Surface(
+            (right_x - left_x + 2 * padding + 1, bottom_y - top_y + 2 * padding + 1)
+        )
+        grid_lines_surface.fill(constants.color_dict["transparent"])
+        grid_lines_surface.set_colorkey(
+            constants.color_dict["transparent"], pygame.RLEACCEL
+        )
+
+        def surface_point(coordinates):
+            pixel_x, pixel_y = self.convert_coordinates(coordinates)
+            return (pixel_x - origin_x, pixel_y - origin_y)
+
+        if flags.show_grid_lines:
+            vertical_points = []
+            for x in range(0, self.coordinate_width + 1):
+                if x % 2 == 0:
+                    vertical_points += [(x, 0), (x, self.coordinate_height)]
+                else:
+                    vertical_points += [(x, self.coordinate_height), (x, 0)]
+            horizontal_points = []
+            for y in range(0, self.coordinate_height + 1):
+                if y % 2 == 0:
+                    horizontal_points += [(0, y), (self.coordinate_width, y)]
+                else:
+                    horizontal_points += [(self.coordinate_width, y), (0, y)]
+            for (
+                points
+            ) in (
+                vertical_points,
+                horizontal_points,
+            ):  # each set of lines is drawn as one zigzag polyline - the connecting segments run along the edges, which are covered by the outside lines
+                pygame.draw.lines(
+                    grid_lines_surface,
+                    self.internal_line_rgb,
+                    False,
+                    [surface_point(coordinates) for coordinates in points],
+                    self.grid_line_width,
+                )
+        pygame.draw.lines(
+            grid_lines_surface,
+            self.external_line_rgb,
+            True,
+            [
+                surface_point((0, 0)),
+                surface_point((0, self.coordinate_height)),
+                surface_point((self.coordinate_width, self.coordinate_height)),
+                surface_point((self.coordinate_width, 0)),
+            ],
+            self.grid_line_width + 1,
+        )
+        return (grid_lines_surface, (origin_x, origin_y))
 
     def find_cell_center(self, coordinates):
         """
@@ -310,13 +383,51 @@ class grid(interface_elements.interface_element):
             int tuple: Two values representing x and y pixel coordinates of the bottom left corner of the requested cell
         """
         x, y = coordinates
-        return (
-            (int((self.width / (self.coordinate_width)) * x) + self.x),
-            (
-                constants.display_height
-                - (int((self.height / (self.coordinate_height)) * y) + self.y)
-            ),
-        )
+        pixel_x = self.pixel_x_dict.get(x, None)
+        pixel_y = self.pixel_y_dict.get(y, None)
+        if (
+            pixel_x == None or pixel_y == None
+        ):  # fractional or out of bounds coordinates, like minimap outline corners
+            pixel_x = int((self.width / (self.coordinate_width)) * x) + self.x
+            pixel_y = constants.display_height - (
+                int((self.height / (self.coordinate_height)) * y) + self.y
+            )
+        return (pixel_x, pixel_y)
+
+    def update_pixel_coordinates(self):
+        """
+        Description:
+            Calculates the pixel coordinates of each of this grid's cell corners, allowing convert_coordinates to look them up instead of recalculating them
+        Input:
+            None
+        Output:
+            None
+        """
+        self.pixel_x_dict = {
+            x: int((self.width / (self.coordinate_width)) * x) + self.x
+            for x in range(0, self.coordinate_width + 1)
+        }
+        self.pixel_y_dict = {
+            y: constants.display_height
+            - (int((self.height / (self.coordinate_height)) * y) + self.y)
+            for y in range(0, self.coordinate_height + 1)
+        }
+
+    def set_origin(self, new_x, new_y):
+        """
+        Description:
+            Sets this grid's location at the inputted coordinates
+        Input:
+            int new_x: New x coordinate for this grid's origin
+            int new_y: New y coordinate for this grid's origin
+        Output:
+            None
+        """
+        super().set_origin(new_x, new_y)
+        if (
+            self.pixel_x_dict != None
+        ):  # set_origin is called during initialization before grid size is known
+            self.update_pixel_coordinates()
 
     def get_height(self):
         """
@@ -391,14 +502,14 @@ class grid(interface_elements.interface_element):
         Output:
             cell: Returns a random cell in this grid that fits the inputted requirements
         """
-        allowed_terrains = requirements_dict["allowed_terrains"]
-        possible_cells = []
-        for current_cell in self.get_flat_cell_list():
-            if not current_cell.terrain_handler.terrain in allowed_terrains:
-                continue
-            possible_cells.append(current_cell)
-        if len(possible_cells) == 0:
-            possible_cells.append("none")
+        allowed_terrains = set(requirements_dict["allowed_terrains"])
+        possible_cells = [
+            current_cell
+            for current_cell in self.get_flat_cell_list()
+            if current_cell.terrain_handler.terrain in allowed_terrains
+        ]
+        if not possible_cells:
+            return "none"
         return random.choice(possible_cells)
 
     def create_cells(self):
@@ -410,38 +521,49 @@ class grid(interface_elements.interface_element):
         Output:
             None
         """
-        for x in range(len(self.cell_list)):
-            for y in range(len(self.cell_list[x])):
-                self.create_cell(x, y)
+        cell_size = (
+            self.get_cell_width(),
+            self.get_cell_height(),
+        )  # all cells in a grid are the same size, so only calculate it once
+        for x, y in itertools.product(
+            range(self.coordinate_width), range(self.coordinate_height)
+        ):
+            self.create_cell(x, y, cell_size=cell_size)
+        self.flat_cell_list = tuple(itertools.chain.from_iterable(self.cell_list))
         for current_cell in self.get_flat_cell_list():
             current_cell.find_adjacent_cells()
 
-    def get_flat_cell_list(self) -> List[cells.cell]:
+    def get_flat_cell_list(self) -> Tuple[cells.cell, ...]:
         """
         Description:
-            Generates and returns a flattened version of this grid's 2-dimensional cell list
+            Returns a flattened version of this grid's 2-dimensional cell list, which is created once after this grid's cells are created
         Input:
             None
         Output:
-            cell list: Returns a flattened version of this grid's 2-dimensional cell list
+            cell tuple: Returns a flattened version of this grid's 2-dimensional cell list
         """
-        return itertools.chain.from_iterable(self.cell_list)
+        return self.flat_cell_list
 
-    def create_cell(self, x, y, save_dict="none") -> cells.cell:
+    def create_cell(
+        self, x, y, save_dict="none", cell_size: Tuple[int, int] = None
+    ) -> cells.cell:
         """
         Description:
             Creates a cell at the inputted coordinates
         Input:
             int x: x coordinate at which to create a cell
             int y: y coordinate at which to create a cell
+            int tuple cell_size: Pixel width and height of the cell, calculated from this grid's size if not given
         Output:
             cell: Returns created cell
         """
+        if cell_size == None:
+            cell_size = (self.get_cell_width(), self.get_cell_height())
         return cells.cell(
             x,
             y,
-            self.get_cell_width(),
-            self.get_cell_height(),
+            cell_size[0],
+            cell_size[1],
             self,
             constants.color_dict["bright green"],
             save_dict,
@@ -493,7 +615,8 @@ class grid(interface_elements.interface_element):
             None
         """
         super().remove()
-        status.grid_list = utility.remove_from_list(status.grid_list, self)
+        if self in status.grid_list:
+            status.grid_list.remove(self)
 
 
 class mini_grid(grid):
@@ -528,6 +651,11 @@ class mini_grid(grid):
         self.attached_grid.mini_grids.append(self)
         self.center_x = 0
         self.center_y = 0
+        self.half_width: int = (
+            self.coordinate_width - 1
+        ) // 2  # if width is 5, ((5 - 1) // 2) = 2, since 2 is the center of a 5 width grid starting at 0
+        self.half_height: int = (self.coordinate_height - 1) // 2
+        self.update_mini_grid_coordinates()
 
     def calibrate(self, center_x, center_y, recursive=False):
         """
@@ -543,6 +671,7 @@ class mini_grid(grid):
         if constants.current_game_mode in self.modes:
             self.center_x = center_x
             self.center_y = center_y
+            self.update_mini_grid_coordinates()  # refresh before anything else can convert coordinates with the new center
             if not recursive:
                 for mini_grid in self.attached_grid.mini_grids:
                     if mini_grid != self:
@@ -551,18 +680,49 @@ class mini_grid(grid):
                     status.tile_info_display,
                     self.attached_grid.find_cell(self.center_x, self.center_y).tile,
                 )  # calibrate tile display information to centered tile
-            for current_cell in self.get_flat_cell_list():
-                attached_x, attached_y = self.get_main_grid_coordinates(
-                    current_cell.x, current_cell.y
+            x_offset = self.center_x - self.half_width
+            y_offset = self.center_y - self.half_height
+            attached_cell_list = self.attached_grid.cell_list
+            attached_width = self.attached_grid.coordinate_width
+            attached_height = self.attached_grid.coordinate_height
+            for (
+                current_cell
+            ) in (
+                self.get_flat_cell_list()
+            ):  # same conversion as get_main_grid_coordinates, with the attached grid's values read once
+                current_cell.copy(
+                    attached_cell_list[(current_cell.x + x_offset) % attached_width][
+                        (current_cell.y + y_offset) % attached_height
+                    ]
                 )
-                attached_cell = self.attached_grid.find_cell(attached_x, attached_y)
-                current_cell.copy(attached_cell)
             for current_mob in status.mob_list:
                 if current_mob.images[0].current_cell != "none":
                     for current_image in current_mob.images:
                         if current_image.grid == self:
                             current_image.add_to_cell()
 
+    def update_mini_grid_coordinates(self):
+        """
+        Description:
+            Records the coordinates on this grid corresponding to each attached grid coordinate this grid currently covers, allowing actor images to find their
+                location on this grid with 1 lookup each frame
+        Input:
+            None
+        Output:
+            None
+        """
+        attached_width = self.attached_grid.coordinate_width
+        attached_height = self.attached_grid.coordinate_height
+        self.mini_grid_coordinates: Dict[Tuple[int, int], Tuple[int, int]] = {
+            (
+                (self.center_x + mini_x - self.half_width) % attached_width,
+                (self.center_y + mini_y - self.half_height) % attached_height,
+            ): (mini_x, mini_y)
+            for mini_x, mini_y in itertools.product(
+                range(self.coordinate_width), range(self.coordinate_height)
+            )
+        }
+
     def get_main_grid_coordinates(self, mini_x, mini_y):
         """
         Description:
@@ -574,19 +734,12 @@ class mini_grid(grid):
             int: x coordinate of the attached grid corresponding to the inputted x coordinate
             int: y coordinate of the attached grid corresponding to the inputted y coordinate
         """
-        attached_x = (
-            self.center_x + mini_x - round((self.coordinate_width - 1) / 2)
-        )  # if width is 5, ((5 - 1) / 2) = (4 / 2) = 2, since 2 is the center of a 5 width grid starting at 0
-        attached_y = self.center_y + mini_y - round((self.coordinate_height - 1) / 2)
-        if attached_x < 0:
-            attached_x += self.attached_grid.coordinate_width
-        elif attached_x >= self.attached_grid.coordinate_width:
-            attached_x -= self.attached_grid.coordinate_width
-        if attached_y < 0:
-            attached_y += self.attached_grid.coordinate_height
-        elif attached_y >= self.attached_grid.coordinate_height:
-            attached_y -= self.attached_grid.coordinate_height
-        return (attached_x, attached_y)
+        return (
+            (self.center_x + mini_x - self.half_width)
+            % self.attached_grid.coordinate_width,
+            (self.center_y + mini_y - self.half_height)
+            % self.attached_grid.coordinate_height,
+        )  # modulo wraps coordinates past either edge of the attached grid to the other side
 
     def get_mini_grid_coordinates(self, original_x, original_y):
         """
@@ -599,16 +752,16 @@ class mini_grid(grid):
             int: x coordinate of this grid corresponding to the inputted x coordinate
             int: y coordinate of this grid corresponding to the inputted y coordinate
         """
+        if (original_x, original_y) in self.mini_grid_coordinates:
+            return self.mini_grid_coordinates[(original_x, original_y)]
         return (
             (
-                int(original_x - self.center_x + (round(self.coordinate_width - 1) / 2))
+                (original_x - self.center_x + self.half_width)
                 % status.strategic_map_grid.coordinate_width
             )
             % self.coordinate_width,
             (
-                int(
-                    original_y - self.center_y + round((self.coordinate_height - 1) / 2)
-                )
+                (original_y - self.center_y + self.half_height)
                 % status.strategic_map_grid.coordinate_height
             )
             % self.coordinate_height,
@@ -624,21 +777,7 @@ class mini_grid(grid):
         Output:
             boolean: Returns True if the inputted attache grid coordinates are within the boundaries of this grid, otherwise returns False
         """
-        minimap_x = (
-            original_x - self.center_x + (round(self.coordinate_width - 1) / 2)
-        ) % self.attached_grid.coordinate_width
-        minimap_y = (
-            original_y - self.center_y + (round(self.coordinate_height - 1) / 2)
-        ) % self.attached_grid.coordinate_height
-        if (
-            minimap_x >= 0
-            and minimap_x < self.coordinate_width
-            and minimap_y >= 0
-            and minimap_y < self.coordinate_height
-        ):
-            return True
-        else:
-            return False
+        return (original_x, original_y) in self.mini_grid_coordinates
 
     def draw_grid_lines(self):
         """
@@ -649,70 +788,13 @@ class mini_grid(grid):
         Output:
             None
         """
+        super().draw_grid_lines()
         if (
-            self == status.scrolling_strategic_map_grid
+            self.is_scrolling_strategic_map_grid
+            and constants.effect_manager.effect_active("allow_planet_mask")
+            and flags.show_planet_mask
         ):  # Scrolling map acts more like a default grid than normal minimap
-            super().draw_grid_lines()
-            if (
-                constants.effect_manager.effect_active("allow_planet_mask")
-                and flags.show_planet_mask
-            ):
-                status.planet_view_mask.draw()
-            return
-
-        left_x, down_y = (0, 0)
-        right_x, up_y = (self.coordinate_width, self.coordinate_height)
-        if flags.show_grid_lines:
-            for x in range(0, self.coordinate_width + 1):
-                pygame.draw.line(
-                    constants.game_display,
-                    constants.color_dict[self.internal_line_color],
-                    self.convert_coordinates((x, 0)),
-                    self.convert_coordinates((x, self.coordinate_height)),
-                    self.grid_line_width,
-                )
-
-            for y in range(0, self.coordinate_height + 1):
-                pygame.draw.line(
-                    constants.game_display,
-                    constants.color_dict[self.internal_line_color],
-                    self.convert_coordinates((0, y)),
-                    self.convert_coordinates((self.coordinate_width, y)),
-                    self.grid_line_width,
-                )
-
-        for y in range(0, self.coordinate_height + 1):
-            pygame.draw.line(
-                constants.game_display,
-                constants.color_dict[self.external_line_color],
-                self.convert_coordinates((left_x, down_y)),
-                self.convert_coordinates((left_x, up_y)),
-                self.grid_line_width + 1,
-            )
-
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((left_x, up_y)),
-            self.convert_coordinates((right_x, up_y)),
-            self.grid_line_width + 1,
-        )
-
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((right_x, up_y)),
-            self.convert_coordinates((right_x, down_y)),
-            self.grid_line_width + 1,
-        )
-
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((right_x, down_y)),
-            self.convert_coordinates((left_x, down_y)),
-            self.grid_line_width + 1,
-        )
+            status.planet_view_mask.draw()
 
 
 class abstract_grid(grid):
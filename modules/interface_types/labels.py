@@ -190,6 +190,7 @@ class money_label_template(value_label):
             None
         """
         input_dict["value_name"] = "money"
+        self.update_scheduled = False
         super().__init__(input_dict)
 
     def update_label(self, new_value):
@@ -227,8 +228,21 @@ class money_label_template(value_label):
         Output:
             None
         """
+        self.update_scheduled = False
         self.update_label(getattr(constants, self.tracker.value_key))
 
+    def schedule_update(self):
+        """
+        Description:
+            Marks this label's projected income as outdated, causing check_for_updates to be called once at the start of the next frame - allows many changes in the same
+                frame, like hiring or disbanding several workers, to only recalculate the projected income once
+        Input:
+            None
+        Output:
+            None
+        """
+        self.update_scheduled = True
+
     def update_tooltip(self):
         """
         Description:
@@ -2,7 +2,9 @@
 
 import random
 import json
-from typing import Dict, List
+import functools
+import types
+from typing import Dict, List, Mapping, Tuple
 from .grids import grid, mini_grid, abstract_grid
 from .cells import cell
 from ..util import scaling, utility
@@ -112,16 +114,15 @@ class world_grid(grid):
         elif self.get_tuning("mars_preset"):
             default_temperature = self.get_tuning("mars_base_temperature")
 
+        initial_temperature_variation = self.get_tuning(
+            "initial_temperature_variation"
+        )
+        min_initial_temperature = default_temperature - initial_temperature_variation
+        max_initial_temperature = default_temperature + initial_temperature_variation
         for cell in self.get_flat_cell_list():
             cell.set_parameter(
                 "temperature",
-                random.randrange(
-                    default_temperature
-                    - self.get_tuning("initial_temperature_variation"),
-                    default_temperature
-                    + self.get_tuning("initial_temperature_variation")
-                    + 1,
-                ),
+                random.randrange(min_initial_temperature, max_initial_temperature + 1),
             )
         if self.get_tuning("smooth_temperature"):
             while self.smooth(
@@ -295,22 +296,26 @@ class world_grid(grid):
         """
         best_frozen = None
         best_liquid = None
+        best_frozen_temperature = None
+        best_liquid_altitude = None
+        boiling_point = self.get_tuning("water_boiling_point")
         for candidate in self.sample(k=self.get_tuning("water_placement_candidates")):
-            if candidate.get_parameter("water") < 6:
+            terrain_parameters = candidate.terrain_handler.terrain_parameters
+            if terrain_parameters["water"] < 6:
+                temperature = terrain_parameters["temperature"]
                 if (
-                    candidate.get_parameter("temperature") <= frozen_bound
+                    temperature <= frozen_bound
                 ):  # Water can go to coldest freezing location
-                    if best_frozen == None or candidate.get_parameter(
-                        "temperature"
-                    ) < best_frozen.get_parameter("temperature"):
+                    if best_frozen == None or temperature < best_frozen_temperature:
                         best_frozen = candidate
-                elif candidate.get_parameter("temperature") < self.get_tuning(
-                    "water_boiling_point"
+                        best_frozen_temperature = temperature
+                elif (
+                    temperature < boiling_point
                 ):  # Water can go to lowest liquid location
-                    if best_liquid == None or candidate.get_parameter(
-                        "altitude"
-                    ) < best_liquid.get_parameter("altitude"):
+                    altitude = terrain_parameters["altitude"]
+                    if best_liquid == None or altitude < best_liquid_altitude:
                         best_liquid = candidate
+                        best_liquid_altitude = altitude
 
         if best_frozen and best_liquid:
             choice = random.choices(
@@ -359,11 +364,11 @@ class world_grid(grid):
             None
         """
         if self.get_tuning("earth_preset"):
-            for cell in self.get_flat_cell_list():
-                cell.set_parameter("soil", random.randrange(1, 7))
+            max_soil = 6
         else:
-            for cell in self.get_flat_cell_list():
-                cell.set_parameter("soil", random.randrange(1, 4))
+            max_soil = 3
+        for cell in self.get_flat_cell_list():
+            cell.set_parameter("soil", random.randrange(1, max_soil + 1))
         self.smooth("soil")
 
     def generate_vegetation(self) -> None:
@@ -421,13 +426,11 @@ class world_grid(grid):
             None
         """
         for cell in self.get_flat_cell_list():
-            cell.set_parameter(
-                parameter,
-                max(
-                    min(cell.get_parameter(parameter), maximum),
-                    minimum,
-                ),
-            )
+            value = cell.get_parameter(parameter)
+            if (
+                value > maximum or value < minimum
+            ):  # only cells outside the bounds need to be set
+                cell.set_parameter(parameter, max(min(value, maximum), minimum))
 
     def smooth(self, parameter: str, direction: str = None) -> bool:
         """
@@ -443,17 +446,16 @@ class world_grid(grid):
         random.shuffle(flat_cell_list)
         smoothed = False
         for cell in flat_cell_list:
+            cell_parameters = (
+                cell.terrain_handler.terrain_parameters
+            )  # read live, since the cell's value can change while comparing it to each neighbor
             for adjacent_cell in cell.adjacent_list:
-                if (
-                    abs(
-                        adjacent_cell.get_parameter(parameter)
-                        - cell.get_parameter(parameter)
-                    )
-                    >= 2
-                ):
-                    if cell.get_parameter(parameter) > adjacent_cell.get_parameter(
-                        parameter
-                    ):
+                difference = (
+                    cell_parameters[parameter]
+                    - adjacent_cell.terrain_handler.terrain_parameters[parameter]
+                )
+                if abs(difference) >= 2:
+                    if difference > 0:
                         if direction != "up":
                             cell.change_parameter(parameter, -1)
                     else:
@@ -535,14 +537,12 @@ class world_grid(grid):
                 current_x, current_y = selected_cell.x, selected_cell.y
             else:
                 direction = random.randrange(1, 5)  # 1 north, 2 east, 3 south, 4 west
-                if direction == 3:
-                    current_y = (current_y + 1) % self.coordinate_height
-                elif direction == 2:
-                    current_x = (current_x + 1) % self.coordinate_width
-                elif direction == 1:
-                    current_y = (current_y - 1) % self.coordinate_height
-                elif direction == 4:
-                    current_x = (current_x - 1) % self.coordinate_width
+                current_x = (
+                    current_x + (0, 0, 1, 0, -1)[direction]
+                ) % self.coordinate_width
+                current_y = (
+                    current_y + (0, -1, 0, 1, 0)[direction]
+                ) % self.coordinate_height
 
     def generate_terrain_features(self):
         """
@@ -553,13 +553,20 @@ class world_grid(grid):
         Output:
             None
         """
+        changed_cells = {}
         for terrain_feature_type in status.terrain_feature_types:
             for cell in self.get_flat_cell_list():
                 if status.terrain_feature_types[terrain_feature_type].allow_place(cell):
                     cell.terrain_handler.terrain_features[terrain_feature_type] = {
                         "feature_type": terrain_feature_type
                     }
-                    cell.tile.update_image_bundle()
+                    changed_cells[cell] = True
+        for (
+            cell
+        ) in (
+            changed_cells
+        ):  # update each tile's image once after all of its features are placed
+            cell.tile.update_image_bundle()
 
     def x_distance(self, cell1, cell2):
         """
@@ -615,25 +622,11 @@ class world_grid(grid):
         Input:
             None
         Output:
-            dictionary: Returns a dictionary in the format
-                {'savannah': [('none', 140), ('diamond', 142)]}
+            dictionary: Returns a read-only dictionary in the format
+                {'savannah': (('none', 140), ('diamond', 142))}
                 for resource_frequencies.json {'savannah': {'none': 140, 'diamond': 2}}
         """
-        file = open("configuration/resource_frequencies.json")
-        resource_frequencies = json.load(file)
-        resource_list_dict = {}
-        for current_terrain in resource_frequencies:
-            resource_list_dict[current_terrain] = []
-            total_frequency = 0
-            for current_resource in resource_frequencies[current_terrain]:
-                total_frequency += resource_frequencies[current_terrain][
-                    current_resource
-                ]
-                resource_list_dict[current_terrain].append(
-                    (current_resource, total_frequency)
-                )
-        file.close()
-        return resource_list_dict
+        return load_resource_list_dict()
 
     def make_random_terrain_worm(self, min_len, max_len, possible_terrains):
         """
@@ -652,20 +645,20 @@ class world_grid(grid):
         current_y = start_y
         worm_length = random.randrange(min_len, max_len + 1)
         terrain = random.choice(possible_terrains)
-        self.find_cell(current_x, current_y).terrain_handler.set_terrain(terrain)
-        counter = 0
-        while not counter == worm_length:
-            counter = counter + 1
-            direction = random.randrange(1, 5)  # 1 north, 2 east, 3 south, 4 west
-            if direction == 3:
-                current_y = (current_y + 1) % self.coordinate_height
-            elif direction == 2:
-                current_x = (current_x + 1) % self.coordinate_width
-            elif direction == 1:
-                current_y = (current_y - 1) % self.coordinate_height
-            elif direction == 4:
-                current_x = (current_x - 1) % self.coordinate_width
-            self.find_cell(current_x, current_y).terrain_handler.set_terrain(terrain)
+        worm_coordinates = {(current_x, current_y)}
+        for x_change, y_change in random.choices(
+            [(0, -1), (1, 0), (0, 1), (-1, 0)], k=worm_length
+        ):  # north, east, south, west
+            current_x = (current_x + x_change) % self.coordinate_width
+            current_y = (current_y + y_change) % self.coordinate_height
+            worm_coordinates.add((current_x, current_y))
+        for (
+            current_x,
+            current_y,
+        ) in (
+            worm_coordinates
+        ):  # worm can cross itself, but each cell only needs its terrain set once
+            self.cell_list[current_x][current_y].terrain_handler.set_terrain(terrain)
 
     def parameter_weighted_sample(
         self, parameter: str, restrict_to: List[cell] = None, k: int = 1
@@ -681,7 +674,6 @@ class world_grid(grid):
         """
         if not restrict_to:
             cell_list = self.get_flat_cell_list()
-            cell_list = [cell for cell in cell_list]  # Converts from chain to list
         else:
             cell_list = restrict_to
 
@@ -691,7 +683,7 @@ class world_grid(grid):
             weight_list = [
                 getattr(cell.terrain_handler, parameter) for cell in cell_list
             ]
-        return random.choices(list(cell_list), weights=weight_list, k=k)
+        return random.choices(cell_list, weights=weight_list, k=k)
 
     def sample(self, k: int = 1):
         """
@@ -702,7 +694,7 @@ class world_grid(grid):
         Output:
             list: Returns a list of k cells
         """
-        return random.choices(list(self.get_flat_cell_list()), k=k)
+        return random.choices(self.get_flat_cell_list(), k=k)
 
     def generate_poles_and_equator(self):
         """
@@ -775,6 +767,32 @@ class world_grid(grid):
                 status.equator.append(cell)
 
 
+@functools.lru_cache(maxsize=None)
+def load_resource_list_dict() -> Mapping[str, Tuple[Tuple[str, int], ...]]:
+    """
+    Description:
+        Reads resource_frequencies.json and returns the cumulative frequency of each resource type in each terrain, only reading the file the first time it is called.
+            The same result is shared by every caller, so it is returned as a read-only mapping of tuples
+    Input:
+        None
+    Output:
+        dictionary: Returns a read-only dictionary in the format
+            {'savannah': (('none', 140), ('diamond', 142))}
+            for resource_frequencies.json {'savannah': {'none': 140, 'diamond': 2}}
+    """
+    with open("configuration/resource_frequencies.json") as file:
+        resource_frequencies = json.load(file)
+    resource_list_dict = {}
+    for current_terrain in resource_frequencies:
+        resource_list = []
+        total_frequency = 0
+        for current_resource in resource_frequencies[current_terrain]:
+            total_frequency += resource_frequencies[current_terrain][current_resource]
+            resource_list.append((current_resource, total_frequency))
+        resource_list_dict[current_terrain] = tuple(resource_list)
+    return types.MappingProxyType(resource_list_dict)
+
+
 def create(from_save: bool, grid_type: str, input_dict: Dict[str, any] = None) -> grid:
     """
     Description:
@@ -24,6 +24,8 @@ def main_loop():
         None
     """
     while not flags.crashed:
+        if constants.money_label and constants.money_label.update_scheduled:
+            constants.money_label.check_for_updates()
         if not flags.loading:
             main_loop_utility.update_display()
         else:
@@ -5,7 +5,8 @@ from ...util import csv_utility, utility, actor_utility
 import modules.constants.status as status
 import json
 import random
-import pygame
+import itertools
+import collections
 
 
 class character_manager_template:
@@ -22,6 +23,9 @@ class character_manager_template:
         Output:
             None
         """
+        self.name_lists: Dict[
+            Tuple[str, bool, bool], Tuple[str, ...]
+        ] = {}  # Names for each (ethnicity, last, masculine) combination, only read from disk the first time a name is needed from that file
         self.demographics_setup()
         self.appearances_setup()
 
@@ -48,44 +52,67 @@ class character_manager_template:
             "hat",
             "portrait",
         ]
-        self.skin_colors: Dict[str, List[Tuple[int, int, int]]] = {}
-        for ethnicity, color_list in appearances_dict["skin_color"].items():
-            self.skin_colors[ethnicity] = []
-            for color in color_list:
-                self.skin_colors[ethnicity].append(
-                    pygame.image.load(
-                        f"graphics/ministers/portraits/base_skin/colors/color{color}.png"
-                    ).get_at((0, 0))[:3]
+        self.portrait_section_metadata: Dict[str, Dict[str, str]] = {
+            section: {"portrait_section": section}
+            for section in [
+                "skin",
+                "mouth",
+                "nose",
+                "eyes",
+                "hair",
+                "outfit",
+                "facial_hair",
+                "glasses",
+                "hat",
+                "portrait",
+                "full_body",
+            ]
+        }  # Each portrait section's metadata dict is shared by every portrait, rather than rebuilt for each section of each portrait - never edited after creation
+        self.skin_colors: Dict[str, List[Tuple[int, int, int]]] = {
+            ethnicity: [
+                actor_utility.get_image_color(
+                    f"graphics/ministers/portraits/base_skin/colors/color{color}.png"
                 )
-                # Get RGB values of first pixel's color from each skin color image in the allowed [0, 1, ...] numbers for that ethnicity
-
-        self.hair_colors: Dict[str, List[Tuple[int, int, int]]] = {}
-        for ethnicity, color_list in appearances_dict["hair_color"].items():
-            self.hair_colors[ethnicity] = []
-            for color in color_list:
-                self.hair_colors[ethnicity].append(
-                    pygame.image.load(
-                        f"graphics/ministers/portraits/hair/colors/color{color}.png"
-                    ).get_at((0, 0))[:3]
+                for color in color_list
+            ]
+            for ethnicity, color_list in appearances_dict["skin_color"].items()
+        }  # Get RGB values of first pixel's color from each skin color image in the allowed [0, 1, ...] numbers for that ethnicity
+
+        self.hair_colors: Dict[str, List[Tuple[int, int, int]]] = {
+            ethnicity: [
+                actor_utility.get_image_color(
+                    f"graphics/ministers/portraits/hair/colors/color{color}.png"
                 )
+                for color in color_list
+            ]
+            for ethnicity, color_list in appearances_dict["hair_color"].items()
+        }
 
         self.hair_types: dict = {}
         for ethnicity, hair_type_dict in appearances_dict["hair_types"].items():
             self.hair_types[ethnicity] = hair_type_dict
+        self.hair_type_choices: Dict[str, Tuple[List[str], List[float]]] = {
+            ethnicity: (
+                list(hair_type_dict.keys()),
+                list(itertools.accumulate(hair_type_dict.values())),
+            )
+            for ethnicity, hair_type_dict in self.hair_types.items()
+            if ethnicity != "types"
+        }  # Each ethnicity's hair types and their cumulative weights, calculated once instead of for each character
 
         self.facial_hair_frequencies: Dict[str, float] = {}
         for ethnicity, frequency in appearances_dict["facial_hair"].items():
             self.facial_hair_frequencies[ethnicity] = frequency
 
-        self.eye_colors: Dict[str, List[Tuple[int, int, int]]] = {}
-        for ethnicity, color_list in appearances_dict["eye_color"].items():
-            self.eye_colors[ethnicity] = []
-            for color in color_list:
-                self.eye_colors[ethnicity].append(
-                    pygame.image.load(
-                        f"graphics/ministers/portraits/eyes/colors/color{color}.png"
-                    ).get_at((0, 0))[:3]
+        self.eye_colors: Dict[str, List[Tuple[int, int, int]]] = {
+            ethnicity: [
+                actor_utility.get_image_color(
+                    f"graphics/ministers/portraits/eyes/colors/color{color}.png"
                 )
+                for color in color_list
+            ]
+            for ethnicity, color_list in appearances_dict["eye_color"].items()
+        }
 
         self.clothing_colors: List[
             Tuple[int, int, int]
@@ -98,19 +125,21 @@ class character_manager_template:
             "ministers/portraits/outfit/accessory_colors/"
         )
 
-        self.skin_images: Dict[bool, List[str]] = {
-            True: actor_utility.get_image_variants(
-                "ministers/portraits/base_skin/default.png", "masculine"
-            ),
-            False: actor_utility.get_image_variants(
+        self.skin_images: Tuple[Tuple[str, ...], Tuple[str, ...]] = (
+            actor_utility.get_image_variants(
                 "ministers/portraits/base_skin/default.png", "feminine"
             ),
-        }
-        self.hat_images: List[str] = actor_utility.get_image_variants(
+            actor_utility.get_image_variants(
+                "ministers/portraits/base_skin/default.png", "masculine"
+            ),
+        )  # Indexed by masculine, as False/True are 0/1
+        self.hat_images: Tuple[str, ...] = actor_utility.get_image_variants(
             "ministers/portraits/hat/default.png", "hat"
         )
 
-        self.hair_images: Dict[bool, Dict[str, List[str]]] = {True: {}, False: {}}
+        self.hair_images: Tuple[
+            Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, ...]]
+        ] = ({}, {})
         for hair_type in self.hair_types["types"]:
             self.hair_images[True][hair_type] = actor_utility.get_image_variants(
                 f"ministers/portraits/hair/masculine/default.png", hair_type
@@ -119,56 +148,40 @@ class character_manager_template:
                 f"ministers/portraits/hair/feminine/default.png", hair_type
             )
 
-        self.outfit_images: List[str] = actor_utility.get_image_variants(
+        self.outfit_images: Tuple[str, ...] = actor_utility.get_image_variants(
             "ministers/portraits/outfit/default.png", "outfit"
         )
-        self.facial_hair_images: List[str] = actor_utility.get_image_variants(
+        self.facial_hair_images: Tuple[str, ...] = actor_utility.get_image_variants(
             f"ministers/portraits/facial_hair/default.png", "facial_hair"
         )
-        self.accessories_images: Dict[str, List[str]] = {
+        self.accessories_images: Dict[str, Tuple[str, ...]] = {
             "glasses": actor_utility.get_image_variants(
                 f"ministers/portraits/accessories/default.png", "glasses"
             ),
         }
-        self.mouth_images: List[str] = actor_utility.get_image_variants(
+        self.mouth_images: Tuple[str, ...] = actor_utility.get_image_variants(
             f"ministers/portraits/mouth/default.png", "mouth"
         )
-        self.exaggerated_mouth_images: List[str] = actor_utility.get_image_variants(
+        self.exaggerated_mouth_images: Tuple[
+            str, ...
+        ] = actor_utility.get_image_variants(
             f"ministers/portraits/mouth/default.png", "exaggerated"
         )
-        self.nose_images: List[str] = actor_utility.get_image_variants(
+        self.nose_images: Tuple[str, ...] = actor_utility.get_image_variants(
             f"ministers/portraits/nose/default.png", "nose"
         )
-        self.eyes_images: Dict[bool, List[str]] = {
-            True: actor_utility.get_image_variants(
-                "ministers/portraits/eyes/default.png", "masculine"
-            ),
-            False: actor_utility.get_image_variants(
+        self.eyes_images: Tuple[Tuple[str, ...], Tuple[str, ...]] = (
+            actor_utility.get_image_variants(
                 "ministers/portraits/eyes/default.png", "feminine"
             ),
-        }
-        self.portrait_images: List[str] = actor_utility.get_image_variants(
+            actor_utility.get_image_variants(
+                "ministers/portraits/eyes/default.png", "masculine"
+            ),
+        )
+        self.portrait_images: Tuple[str, ...] = actor_utility.get_image_variants(
             f"ministers/portraits/portrait/default.png", "portrait"
         )
 
-    def find_portrait_section(self, section: str, portrait_image_id: List[any]) -> int:
-        """
-        Description:
-            Finds the index of a section of the inputted portrait, such as which image dict is the hair section
-        Input:
-            string section: Section to find
-            list portrait_image_id: Portrait list image_id to search through
-        Output:
-            int: Returns index of section in list, if section present
-        """
-        for i, portrait_section in enumerate(portrait_image_id):
-            if (
-                portrait_section.get("metadata", {}).get("portrait_section", None)
-                == section
-            ):
-                return i
-        return None
-
     def generate_unit_portrait(
         self, unit, metadata: Dict[str, any] = None
     ) -> List[Dict[str, any]]:
@@ -187,9 +200,14 @@ class character_manager_template:
             minister_face = self.generate_appearance(
                 unit, full_body=True, metadata=metadata
             )
-            for part in minister_face:
-                part["x_size"] = part.get("size", 1.0) * part.get("x_size", 1.0) * 0.47
-                part["y_size"] = part.get("size", 1.0) * part.get("y_size", 1.0) * 0.47
+            section_indices: Dict[str, int] = {}
+            for i, part in enumerate(minister_face):
+                section_indices.setdefault(
+                    part.get("metadata", {}).get("portrait_section", None), i
+                )  # Index of the first part of each section, recorded while already visiting each part
+                scale = part.get("size", 1.0) * 0.47
+                part["x_size"] = scale * part.get("x_size", 1.0)
+                part["y_size"] = scale * part.get("y_size", 1.0)
                 part["x_offset"] = part.get("x_offset", 0) + 0.01
                 part["y_offset"] = part.get("y_offset", 0) + 0.342
                 part["level"] = part.get("level", 1) - 5
@@ -204,7 +222,7 @@ class character_manager_template:
             ) in (
                 hidden_sections
             ):  # While officer, hide any unapplicable portrait sections but save for later
-                section_index = self.find_portrait_section(section, minister_face)
+                section_index = section_indices.get(section, None)
                 if section_index != None:
                     minister_face[section_index] = {
                         "image_id": "misc/empty.png",
@@ -233,58 +251,61 @@ class character_manager_template:
             ethnicity = minister.ethnicity
         else:
             ethnicity = self.generate_ethnicity()
-        while ethnicity == "diaspora":
-            ethnicity = random.choices(
-                self.ethnic_groups, self.ethnic_group_weights, k=1
-            )[0]
+        if ethnicity == "diaspora":
+            ethnicity = utility.weighted_choice(
+                self.non_diaspora_ethnic_groups,
+                self.non_diaspora_ethnic_group_cumulative_weights,
+            )
         if minister and hasattr(minister, "masculine"):
             masculine = minister.masculine
         else:
-            masculine = random.choice([True, False])
+            masculine = random.random() < 0.5
 
-        hair_color = random.choice(
-            self.hair_colors[ethnicity.lower().replace(" ", "_")]
-        )
+        ethnicity_key = ethnicity.lower().replace(" ", "_")
+        hair_color = random.choice(self.hair_colors[ethnicity_key])
         if (
-            random.randrange(1, 7) == 1
+            random.random() < 1 / 6
         ):  # 1/6 chance of some shade of gray/white hair, regardless of ethnicity
             base = random.randrange(83, 229)
             hair_color = (base, base, base)
 
-        hair_type = random.choices(
-            list(self.hair_types[ethnicity.lower().replace(" ", "_")].keys()),
-            self.hair_types[ethnicity.lower().replace(" ", "_")].values(),
-            k=1,
-        )[0]
+        hair_type_choices, hair_type_cumulative_weights = self.hair_type_choices[
+            ethnicity_key
+        ]
+        hair_type = utility.weighted_choice(
+            hair_type_choices, hair_type_cumulative_weights
+        )
         # Randomly choose hair type from ethnicity's weighted hair types
 
         has_facial_hair = (
             masculine
             and random.random()
-            < self.facial_hair_frequencies[ethnicity.lower().replace(" ", "_")]
+            < self.facial_hair_frequencies[ethnicity_key]
         )
 
         if not metadata:
             metadata = {}
-        metadata.update(
-            {
-                "hair_color": hair_color,
-                "hair_type": hair_type,
-                "skin_color": random.choice(
-                    self.skin_colors[ethnicity.lower().replace(" ", "_")]
-                ),
-                "eye_color": random.choice(
-                    self.eye_colors[ethnicity.lower().replace(" ", "_")]
-                ),
-                "suit_colors": random.sample(self.clothing_colors, 2)
-                + [random.choice(self.accessory_colors)],
-                "has_hat": random.randrange(1, 7) >= 5,
-                "has_facial_hair": has_facial_hair,
-                "full_body": full_body,
-                "ethnicity": ethnicity,
-                "masculine": masculine,
-            }
-        )
+        # Slots are written directly into the single metadata dict, rather than building a temporary dict to update it with
+        metadata["hair_color"] = hair_color
+        metadata["hair_type"] = hair_type
+        metadata["skin_color"] = random.choice(self.skin_colors[ethnicity_key])
+        metadata["eye_color"] = random.choice(self.eye_colors[ethnicity_key])
+        first_suit_index = random.randrange(len(self.clothing_colors))
+        second_suit_index = random.randrange(len(self.clothing_colors) - 1)
+        if (
+            second_suit_index >= first_suit_index
+        ):  # Skips over the first index, giving 2 different suit colors like random.sample without its intermediate lists
+            second_suit_index += 1
+        metadata["suit_colors"] = [
+            self.clothing_colors[first_suit_index],
+            self.clothing_colors[second_suit_index],
+            random.choice(self.accessory_colors),
+        ]
+        metadata["has_hat"] = random.random() < 1 / 3
+        metadata["has_facial_hair"] = has_facial_hair
+        metadata["full_body"] = full_body
+        metadata["ethnicity"] = ethnicity
+        metadata["masculine"] = masculine
 
         self.generate_skin(portrait_sections, metadata)
         self.generate_hair(portrait_sections, metadata)
@@ -293,7 +314,6 @@ class character_manager_template:
         self.generate_mouth(portrait_sections, metadata)
         self.generate_eyes(portrait_sections, metadata)
         self.generate_accessories(portrait_sections, metadata)
-        self.generate_portrait(portrait_sections, metadata)
         if full_body:
             self.generate_body(portrait_sections, metadata)
         else:
@@ -323,7 +343,7 @@ class character_manager_template:
                 "x_offset": -0.015,
                 "level": 1,
                 "green_screen": metadata["skin_color"],
-                "metadata": {"portrait_section": "full_body"},
+                "metadata": self.portrait_section_metadata["full_body"],
             }
         )
 
@@ -343,8 +363,8 @@ class character_manager_template:
             {
                 "image_id": random.choice(self.outfit_images),
                 "green_screen": metadata["suit_colors"],
-                "metadata": {"portrait_section": "outfit"},
-                "level": status.HAIR_LEVEL + random.choice([-1, 1]),
+                "metadata": self.portrait_section_metadata["outfit"],
+                "level": status.HAIR_LEVEL + random.choice((-1, 1)),
             }
         )
 
@@ -364,7 +384,7 @@ class character_manager_template:
             {
                 "image_id": random.choice(self.skin_images[metadata["masculine"]]),
                 "green_screen": metadata["skin_color"],
-                "metadata": {"portrait_section": "skin"},
+                "metadata": self.portrait_section_metadata["skin"],
             }
         )
 
@@ -380,18 +400,20 @@ class character_manager_template:
         Output:
             None
         """
-        if random.randrange(1, 11) != 0 or (not metadata["masculine"]):
-            possible_hair_images = self.hair_images[metadata["masculine"]][
-                metadata["hair_type"]
-            ]
+        if (
+            not metadata["masculine"]
+        ) or random.random() >= 0.1:  # 1/10 chance of baldness for masculine characters
+            hair_image = random.choice(
+                self.hair_images[metadata["masculine"]][metadata["hair_type"]]
+            )
         else:
-            possible_hair_images = ["misc/empty.png"]
+            hair_image = "misc/empty.png"
         portrait_sections.append(
             {
-                "image_id": random.choice(possible_hair_images),
+                "image_id": hair_image,
                 "green_screen": metadata["hair_color"],
                 "level": status.HAIR_LEVEL,
-                "metadata": {"portrait_section": "hair"},
+                "metadata": self.portrait_section_metadata["hair"],
             }
         )
 
@@ -412,7 +434,7 @@ class character_manager_template:
                 {
                     "image_id": random.choice(self.facial_hair_images),
                     "green_screen": metadata["hair_color"],
-                    "metadata": {"portrait_section": "facial_hair"},
+                    "metadata": self.portrait_section_metadata["facial_hair"],
                     "level": status.FACIAL_HAIR_LEVEL,
                 }
             )
@@ -429,25 +451,25 @@ class character_manager_template:
         Output:
             None
         """
-        if random.randrange(1, 7) >= 4:
+        if random.random() < 0.5:
             portrait_sections.append(
                 {
                     "image_id": random.choice(self.accessories_images["glasses"]),
                     "green_screen": random.choice(self.clothing_colors),
                     "level": status.GLASSES_LEVEL,
-                    "metadata": {"portrait_section": "glasses"},
+                    "metadata": self.portrait_section_metadata["glasses"],
                 }
             )
         if metadata["has_hat"]:
-            hat_images = self.hat_images
+            hat_image = random.choice(self.hat_images)
         else:
-            hat_images = ["misc/empty.png"]
+            hat_image = "misc/empty.png"
         portrait_sections.append(
             {
-                "image_id": random.choice(hat_images),
+                "image_id": hat_image,
                 "green_screen": metadata["suit_colors"],
                 "level": status.HAT_LEVEL,
-                "metadata": {"portrait_section": "hat"},
+                "metadata": self.portrait_section_metadata["hat"],
             }
         )
 
@@ -466,7 +488,7 @@ class character_manager_template:
         portrait_sections.append(
             {
                 "image_id": random.choice(self.nose_images),
-                "metadata": {"portrait_section": "nose"},
+                "metadata": self.portrait_section_metadata["nose"],
             }
         )
 
@@ -489,7 +511,7 @@ class character_manager_template:
         portrait_sections.append(
             {
                 "image_id": image_id,
-                "metadata": {"portrait_section": "mouth"},
+                "metadata": self.portrait_section_metadata["mouth"],
             }
         )
 
@@ -509,7 +531,7 @@ class character_manager_template:
             {
                 "image_id": random.choice(self.eyes_images[metadata["masculine"]]),
                 "green_screen": [metadata["eye_color"], metadata["hair_color"]],
-                "metadata": {"portrait_section": "eyes"},
+                "metadata": self.portrait_section_metadata["eyes"],
                 "level": status.EYES_LEVEL,
             }
         )
@@ -519,21 +541,20 @@ class character_manager_template:
     ) -> None:
         """
         Description:
-            Generates a random background portrait for a character, adding it to the inputted list
+            Generates a random background portrait for a character, adding it to the inputted list - only called for non-full body appearances
         Input:
             image_id list: List of image id's for each portrait section
             dictionary metadata: Metadata for the character, allowing coordination between sections
         Output:
             None
         """
-        if not metadata["full_body"]:
-            portrait_sections.append(
-                {
-                    "image_id": random.choice(self.portrait_images),
-                    "metadata": {"portrait_section": "portrait"},
-                    "level": status.PORTRAIT_LEVEL,
-                }
-            )
+        portrait_sections.append(
+            {
+                "image_id": random.choice(self.portrait_images),
+                "metadata": self.portrait_section_metadata["portrait"],
+                "level": status.PORTRAIT_LEVEL,
+            }
+        )
 
     def demographics_setup(self) -> None:
         """
@@ -562,33 +583,32 @@ class character_manager_template:
         self.country_weights: List[
             int
         ] = []  # List of weighted populations to choose which country someone is from
-        self.country_ethnicity_dict: Dict[
-            str, Dict[str, Dict[str, list]]
+        ethnic_group_total_weights: Dict[str, float] = collections.defaultdict(float)
+        self.country_ethnicity_choices: Dict[
+            str, Tuple[List[str], List[int]]
         ] = (
             {}
-        )  # Allows weighted selection of what ethnicity someone from a particular country is
+        )  # Allows weighted selection of what ethnicity someone from a particular country is - each country's ethnic groups and their cumulative weights, stored together so that they can be found with 1 lookup
         """
         In format:
         {
-            "Russia": {
-                "ethnic_groups": ["Eastern European", "Central Asian", "diaspora"],
-                "ethnic_group_weights": [79, 20, 1]
-            },
+            "Russia": (["Eastern European", "Central Asian", "diaspora"], [79, 99, 100])
             "USA": ...
         }
         """
-        ethnic_group_total_weights: Dict[str, float] = {}
-        for group in country_dict:
-            for country in country_dict[group]["populations"]:
+        for group_dict in country_dict.values():
+            demographics = group_dict["demographics"]
+            space_representation = group_dict["metadata"]["space_representation"]
+            functional_country_ethnicities: Dict[
+                str, Tuple[List[str], List[int]]
+            ] = (
+                {}
+            )  # Countries with the same functional country share the same ethnicity lists instead of building copies
+            for country, population in group_dict["populations"].items():
                 if country.startswith("Misc."):
-                    self.miscellaneous_countries[country] = country_dict[group][
-                        "miscellaneous"
-                    ]
+                    self.miscellaneous_countries[country] = group_dict["miscellaneous"]
                 self.countries_of_origin.append(country)
-                country_weighted_population = (
-                    country_dict[group]["populations"][country]
-                    * country_dict[group]["metadata"]["space_representation"]
-                )
+                country_weighted_population = population * space_representation
                 self.country_weights.append(country_weighted_population)
                 # The chance of each country being selected for a character is proportional to the country's population and space representation
 
@@ -597,81 +617,92 @@ class character_manager_template:
                 else:
                     cycled_countries = [country]
                 for current_country in cycled_countries:
-                    self.country_ethnicity_dict[current_country] = {
-                        "ethnic_groups": [],
-                        "ethnic_group_weights": [],
-                    }
                     # The ethnicity of a character from a country is randomly selected from the country's demographic groups
-                    if current_country in country_dict[group]["demographics"]:
-                        if (
-                            type(country_dict[group]["demographics"][current_country])
-                            == str
-                        ):
-                            functional_country = country_dict[group]["demographics"][
+                    if current_country in demographics:
+                        if isinstance(demographics[current_country], str):
+                            functional_country = demographics[
                                 current_country
                             ]  # Some countries will have equivalent demographics to another country
                         else:
                             functional_country = current_country
                     else:
                         functional_country = "default"  # Some countries will use the default demographics for their country group
-                    for ethnicity in country_dict[group]["demographics"][
-                        functional_country
-                    ]:
-                        ethnic_percentage = country_dict[group]["demographics"][
-                            functional_country
-                        ][ethnicity]
-                        self.country_ethnicity_dict[current_country][
-                            "ethnic_groups"
-                        ].append(ethnicity)
-                        self.country_ethnicity_dict[current_country][
-                            "ethnic_group_weights"
-                        ].append(ethnic_percentage)
-                        if (
-                            current_country == cycled_countries[0]
-                        ):  # Don't repeat counts for misc. countries
-                            ethnic_group_total_weights[
-                                ethnicity
-                            ] = ethnic_group_total_weights.get(ethnicity, 0) + (
+                    functional_demographics = demographics[functional_country]
+                    if not functional_country in functional_country_ethnicities:
+                        functional_country_ethnicities[functional_country] = (
+                            list(functional_demographics.keys()),
+                            list(
+                                itertools.accumulate(functional_demographics.values())
+                            ),
+                        )
+                    self.country_ethnicity_choices[
+                        current_country
+                    ] = functional_country_ethnicities[functional_country]
+                    if (
+                        current_country == cycled_countries[0]
+                    ):  # Don't repeat counts for misc. countries
+                        for (
+                            ethnicity,
+                            ethnic_percentage,
+                        ) in functional_demographics.items():
+                            ethnic_group_total_weights[ethnicity] += (
                                 ethnic_percentage * country_weighted_population
                             )
 
-        for ethnic_group in ethnic_group_total_weights:
+        for ethnic_group, total_weight in ethnic_group_total_weights.items():
             self.ethnic_groups.append(ethnic_group)
-            self.ethnic_group_weights.append(
-                round(ethnic_group_total_weights[ethnic_group])
-            )
+            self.ethnic_group_weights.append(round(total_weight))
 
-    def demographics_test(self) -> None:
+        # Cumulative weights are calculated once here so that each character's weighted choices only need a binary search
+        self.country_cumulative_weights: List[int] = list(
+            itertools.accumulate(self.country_weights)
+        )
+        self.non_diaspora_ethnic_groups: List[str] = []
+        non_diaspora_ethnic_group_weights: List[int] = []
+        for ethnic_group, weight in zip(self.ethnic_groups, self.ethnic_group_weights):
+            if ethnic_group != "diaspora":
+                self.non_diaspora_ethnic_groups.append(ethnic_group)
+                non_diaspora_ethnic_group_weights.append(weight)
+        self.non_diaspora_ethnic_group_cumulative_weights: List[int] = list(
+            itertools.accumulate(non_diaspora_ethnic_group_weights)
+        )  # Diaspora characters are given a proportionally random ethnicity from all other ethnic groups
+
+    def demographics_test(self, num_characters: int = 100) -> None:
         """
         Description:
-            Prints 100 random names to the console
+            Prints random names to the console
         Input:
-            None
+            int num_characters: Number of characters to generate names for
         Output:
             None
         """
-        for i in range(100):
+        lines = []
+        for i in range(num_characters):
             country = self.generate_country()
             ethnicity = self.generate_ethnicity(country)
-            masculine = random.choice([True, False])
-            print(
+            masculine = random.random() < 0.5
+            lines.append(
                 f"{self.generate_name(ethnicity=ethnicity, masculine=masculine)}, {utility.generate_article(ethnicity)} {ethnicity} person from {country}"
             )
+        print("\n".join(lines))  # 1 console write instead of 1 per character
 
-    def generate_country(self) -> None:
+    def generate_country(self) -> str:
         """
         Description:
             Generates a country of origin for a character
         Input:
             None
         Output:
-            None
+            string: Returns country of origin for a character
         """
-        country = random.choices(self.countries_of_origin, self.country_weights, k=1)[0]
-        if country.startswith(
-            "Misc."
+        country = utility.weighted_choice(
+            self.countries_of_origin, self.country_cumulative_weights
+        )
+        miscellaneous_countries = self.miscellaneous_countries.get(country, None)
+        if (
+            miscellaneous_countries
         ):  # If selected "Misc." population, choose a miscellaneous country, like Luxembourg for "Misc. Western"
-            country = random.choice(self.miscellaneous_countries[country])
+            country = random.choice(miscellaneous_countries)
         return country
 
     def generate_ethnicity(self, country_of_origin: str = None) -> str:
@@ -685,9 +716,8 @@ class character_manager_template:
         """
         if not country_of_origin:
             country_of_origin = self.generate_country()
-        choices = self.country_ethnicity_dict[country_of_origin]["ethnic_groups"]
-        weights = self.country_ethnicity_dict[country_of_origin]["ethnic_group_weights"]
-        return random.choices(choices, weights, k=1)[0]
+        choices, cumulative_weights = self.country_ethnicity_choices[country_of_origin]
+        return utility.weighted_choice(choices, cumulative_weights)
 
     def generate_name(self, ethnicity: str = None, masculine: bool = False) -> str:
         """
@@ -700,10 +730,11 @@ class character_manager_template:
         """
         if not ethnicity:
             ethnicity = self.generate_ethnicity()
-        while ethnicity == "diaspora":
-            ethnicity = random.choices(
-                self.ethnic_groups, self.ethnic_group_weights, k=1
-            )[0]
+        if ethnicity == "diaspora":
+            ethnicity = utility.weighted_choice(
+                self.non_diaspora_ethnic_groups,
+                self.non_diaspora_ethnic_group_cumulative_weights,
+            )
         return (
             self.get_name(ethnicity, last=False, masculine=masculine),
             self.get_name(ethnicity, last=True),
@@ -722,13 +753,18 @@ class character_manager_template:
         Output:
             string: Returns name for a character
         """
-        if last:
-            file_name = (
-                f"text/names/{ethnicity.lower().replace(' ', '_')}_last_names.csv"
-            )
-        else:
-            if masculine:
-                file_name = f"text/names/{ethnicity.lower().replace(' ', '_')}_first_names_male.csv"
+        name_key = (ethnicity, last, masculine and not last)
+        if not name_key in self.name_lists:
+            if last:
+                file_name = (
+                    f"text/names/{ethnicity.lower().replace(' ', '_')}_last_names.csv"
+                )
             else:
-                file_name = f"text/names/{ethnicity.lower().replace(' ', '_')}_first_names_female.csv"
-        return random.choice(csv_utility.read_csv(file_name))[0]
+                if masculine:
+                    file_name = f"text/names/{ethnicity.lower().replace(' ', '_')}_first_names_male.csv"
+                else:
+                    file_name = f"text/names/{ethnicity.lower().replace(' ', '_')}_first_names_female.csv"
+            self.name_lists[name_key] = tuple(
+                line[0] for line in csv_utility.read_csv(file_name)
+            )
+        return random.choice(self.name_lists[name_key])
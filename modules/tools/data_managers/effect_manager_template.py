@@ -18,6 +18,9 @@ class effect_manager_template:
         """
         self.possible_effects = []
         self.active_effects = []
+        self.active_effect_types = (
+            {}
+        )  # number of active effects of each type, allowing effect_active to be checked every frame without searching active_effects
         file = open("configuration/release_config.json")
 
         # returns JSON object as a dictionary
@@ -74,10 +77,7 @@ class effect_manager_template:
         Output:
             boolean: Returns whether any effect of the inputted type is active
         """
-        for current_effect in self.active_effects:
-            if current_effect.effect_type == effect_type:
-                return True
-        return False
+        return self.active_effect_types.get(effect_type, 0) > 0
 
     def set_effect(self, effect_type, new_status):
         """
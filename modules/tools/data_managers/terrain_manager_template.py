@@ -82,6 +82,16 @@ class terrain_manager_template:
                 6: "deep",
             },
         }
+        self.map_mode_image_ids: Dict[str, Dict[int, str]] = {}
+        for terrain_parameter in self.terrain_parameter_keywords:
+            if terrain_parameter in ["water", "temperature", "vegetation"]:
+                image_folder = f"misc/map_modes/{terrain_parameter}/"
+            else:
+                image_folder = "misc/map_modes/"
+            self.map_mode_image_ids[terrain_parameter] = {
+                value: f"{image_folder}{value}.png"
+                for value in self.terrain_parameter_keywords[terrain_parameter]
+            }  # map mode image of each possible value of each parameter, like 'misc/map_modes/water/3.png'
         self.load_terrains("configuration/TDG.json")
         self.load_tuning("configuration/terrain_generation_tuning.json")
 
@@ -82,7 +82,7 @@ class public_opinion_tracker_template(value_tracker_template):
             None
         """
         super().change(value_change)
-        constants.money_label.check_for_updates()
+        constants.money_label.schedule_update()
         if self.get() <= 0:
             constants.achievement_manager.achieve("Vilified")
         elif self.get() >= 100:
@@ -45,6 +45,9 @@ class effect:
         """
         if not self in self.effect_manager.active_effects:
             self.effect_manager.active_effects.append(self)
+            self.effect_manager.active_effect_types[self.effect_type] = (
+                self.effect_manager.active_effect_types.get(self.effect_type, 0) + 1
+            )
 
     def remove(self):
         """
@@ -59,3 +62,4 @@ class effect:
             self.effect_manager.active_effects = utility.remove_from_list(
                 self.effect_manager.active_effects, self
             )
+            self.effect_manager.active_effect_types[self.effect_type] -= 1
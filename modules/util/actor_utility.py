@@ -4,6 +4,7 @@ import random
 import os
 import pygame
 import math
+import functools
 from typing import List, Tuple
 from . import utility, text_utility
 import modules.constants.constants as constants
@@ -408,15 +409,17 @@ def generate_resource_icon(tile):
     return image_id
 
 
+@functools.lru_cache(maxsize=None)
 def get_image_variants(base_path, keyword="default"):
     """
     Description:
-        Finds and returns a list of all images with the same name format in the same folder, like 'folder/default.png' and 'folder/default1.png'
+        Finds and returns all images with the same name format in the same folder, like 'folder/default.png' and 'folder/default1.png'. Results are cached, since
+            image folders do not change while the game is running and each unit spawn would otherwise rescan its folder
     Input:
         string base_path: File path of base image, like 'folder/default.png'
         string keyword = 'default': Name format to look for
     Output:
-        string list: Returns list of all images with the same name format in the same folder
+        string tuple: Returns tuple of all images with the same name format in the same folder
     """
     variants = []
     if base_path.endswith("default.png"):
@@ -429,7 +432,21 @@ def get_image_variants(base_path, keyword="default"):
                 continue
     else:
         variants.append(base_path)
-    return variants
+    return tuple(variants)
+
+
+@functools.lru_cache(maxsize=None)
+def get_image_color(file_path: str) -> Tuple[int, int, int]:
+    """
+    Description:
+        Finds and returns the RGB values of the first pixel of the inputted image file. Results are cached, since color swatch files are shared between
+            ethnicities and would otherwise be decoded again for each ethnicity that uses them
+    Input:
+        string file_path: File path of image, like 'graphics/ministers/portraits/hair/colors/color0.png'
+    Output:
+        int tuple: Returns (red, green, blue) tuple of the first pixel's color
+    """
+    return tuple(pygame.image.load(file_path).get_at((0, 0))[:3])
 
 
 def extract_folder_colors(folder_path: str) -> List[Tuple[int, int, int]]:
@@ -221,7 +221,8 @@ def to_main_menu(override=False):
     minister_utility.calibrate_minister_info_display(None)
     for current_actor in status.actor_list:
         current_actor.remove_complete()
-    for current_grid in status.grid_list:
+    # grids remove themselves from grid_list in place while this iterates
+    for current_grid in status.grid_list.copy():
         current_grid.remove_complete()
     for current_minister in status.minister_list:
         current_minister.remove_complete()
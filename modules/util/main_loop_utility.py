@@ -359,14 +359,14 @@ def manage_rmb_down(clicked_button):
                             moved_mob = current_cell.contained_mobs[1]
                             for current_image in moved_mob.images:
                                 if not current_image.current_cell == "none":
-                                    while (
-                                        not moved_mob
-                                        == current_image.current_cell.contained_mobs[0]
-                                    ):
-                                        current_image.current_cell.contained_mobs.append(
-                                            current_image.current_cell.contained_mobs.pop(
-                                                0
-                                            )
+                                    contained_mobs = (
+                                        current_image.current_cell.contained_mobs
+                                    )
+                                    moved_index = contained_mobs.index(moved_mob)
+                                    if moved_index > 0:  # rotates in place, since equivalent cells share the same list
+                                        contained_mobs[:] = (
+                                            contained_mobs[moved_index:]
+                                            + contained_mobs[:moved_index]
                                         )
                             flags.show_selection_outlines = True
                             constants.last_selection_outline_switch = (
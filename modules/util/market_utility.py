@@ -54,7 +54,7 @@ def change_price(changed_commodity, num_change):
     if constants.item_prices[changed_commodity] < 1:
         constants.item_prices[changed_commodity] = 1
     status.commodity_prices_label.update_label()
-    constants.money_label.check_for_updates()
+    constants.money_label.schedule_update()
 
 
 def set_price(changed_commodity, new_value):
@@ -87,7 +87,7 @@ def sell(seller, sold_commodity, num_sold):
     """
     constants.sold_commodities[sold_commodity] += num_sold
     seller.change_inventory(sold_commodity, -1 * num_sold)
-    constants.money_label.check_for_updates()
+    constants.money_label.schedule_update()
 
 
 def calculate_total_sale_revenue():
@@ -132,7 +132,7 @@ def attempt_worker_upkeep_change(change_type, worker_type):
                 text_utility.print_to_screen(
                     f"Adding {utility.generate_article(worker_type)} {worker_type} worker to the labor pool decreased {worker_type} worker upkeep from {current_price} to {changed_price}."
                 )
-        constants.money_label.check_for_updates()
+        constants.money_label.schedule_update()
 
 
 def calculate_subsidies(projected=False):
@@ -230,7 +230,7 @@ class loan:
                 + str(self.remaining_duration)
                 + " turns."
             )
-            constants.money_label.check_for_updates()
+            constants.money_label.schedule_update()
 
     def to_save_dict(self):
         """
@@ -1,5 +1,7 @@
 # Contains miscellaneous functions, like removing an item from a list or finding the distance between 2 points
 
+import bisect
+import random
 from typing import List
 
 
@@ -225,3 +227,24 @@ def fahrenheit(temperature: int):
         return temperature * 30 - 70
     else:
         return temperature * 20 - 5
+
+
+def weighted_choice(population: List, cumulative_weights: List[float]):
+    """
+    Description:
+        Returns a random item from the inputted list, with the same distribution as random.choices with the inputted cumulative weights, but without building a
+            result list each call
+    Input:
+        list population: List of items to choose from
+        float list cumulative_weights: Running totals of each item's weight, in the same order as the population
+    Output:
+        any type: Returns the chosen item
+    """
+    return population[
+        bisect.bisect(
+            cumulative_weights,
+            random.random() * cumulative_weights[-1],
+            0,
+            len(population) - 1,
+        )
+    ]